@@ -0,0 +1,4 @@
+"""__init__ module for the benchmarks package"""
+
+from benchmarks.cases import benchmark_cases
+from benchmarks.functions import run_benchmarks, compare_results
@@ -0,0 +1,71 @@
+"""Main module for the benchmarks package"""
+
+import os
+import sys
+import json
+import argparse
+from benchmarks.cases import benchmark_cases
+from benchmarks.functions import run_benchmarks, compare_results, load_results, save_results, measure_import_time
+
+
+default_baseline = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+parser = argparse.ArgumentParser(description="Run the cribbage benchmarks")
+parser.add_argument("names", nargs="*", help="Benchmarks to run (default all)")
+parser.add_argument("--output", help="File to write the results to, as JSON (default standard output)")
+parser.add_argument("--baseline", default=default_baseline, help="Baseline results to compare against")
+parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+parser.add_argument("--threshold", type=float, default=0.2, help="Slowdown that counts as a regression")
+parser.add_argument("--repeat", type=int, default=5, help="Number of timed repeats of each benchmark")
+parser.add_argument("--import-budget", type=float, default=0.1, help="Longest time, in seconds, importing may take")
+
+arguments = parser.parse_args()
+
+for i in arguments.names:
+
+    if i not in benchmark_cases:
+
+        parser.error(f"Unknown benchmark {i}, choose from: {', '.join(benchmark_cases)}")
+
+results = run_benchmarks(names=arguments.names or None, repeat=arguments.repeat)
+
+results["import_seconds"] = measure_import_time(repeat=arguments.repeat)
+
+if arguments.output is None:
+
+    print(json.dumps(results, indent=4, sort_keys=True))
+
+else:
+
+    save_results(results=results, path=arguments.output)
+
+if arguments.save_baseline:
+
+    save_results(results=results, path=arguments.baseline)
+
+elif os.path.exists(arguments.baseline):
+
+    comparison, regressions = compare_results(
+        results=results,
+        baseline=load_results(arguments.baseline),
+        threshold=arguments.threshold
+    )
+
+    for name, ratio in comparison.items():
+
+        flag = "REGRESSION" if name in regressions else ""
+
+        print(f"{name:<40}{ratio:>8.2f}x baseline  {flag}", file=sys.stderr)
+
+    # Fail if anything is slower than the baseline allows
+    if regressions:
+
+        sys.exit(1)
+
+# Fail if importing the package takes longer than the budget
+if results["import_seconds"] > arguments.import_budget:
+
+    print(f"Importing cribbage took {results['import_seconds']:.3f}s, over the budget of {arguments.import_budget}s",
+          file=sys.stderr)
+
+    sys.exit(1)
@@ -0,0 +1,153 @@
+"""Module for defining the benchmark cases"""
+
+import random
+from cribbage import Deck, Hand
+from cribbage.deck import unique_combinations
+from benchmarks.fixtures import fixture_seed, typical_hands, worst_case_hand, six_card_deal, dealt_computer
+
+
+def score_hand_typical():
+    """Benchmark for scoring typical hands"""
+
+    hands = typical_hands()
+
+    def run():
+
+        for hand, shared_card in hands:
+
+            hand.score_hand(shared_card=shared_card)
+
+    return run, len(hands)
+
+
+def score_hand_worst_case():
+    """Benchmark for scoring the highest scoring hand"""
+
+    hand, shared_card = worst_case_hand()
+
+    def run():
+
+        hand.score_hand(shared_card=shared_card)
+
+    return run, 1
+
+
+def unique_combinations_five_cards():
+    """Benchmark for finding every combination of a five card hand, as the show scoring does"""
+
+    hand, shared_card = worst_case_hand()
+
+    cards = hand.cards + [shared_card]
+
+    def run():
+
+        unique_combinations(cards, 1, 5)
+
+    return run, 1
+
+
+def unique_combinations_keeps():
+    """Benchmark for finding every four card keep of a six card hand"""
+
+    six_cards, _ = six_card_deal()
+
+    def run():
+
+        unique_combinations(six_cards, 4, 4)
+
+    return run, 1
+
+
+def unique_combinations_opponent_discards():
+    """Benchmark for finding every pair of the 46 unseen cards"""
+
+    six_cards, deck = six_card_deal()
+
+    unseen_cards = [i for i in deck if i not in six_cards]
+
+    def run():
+
+        unique_combinations(unseen_cards, 2, 2)
+
+    return run, 1
+
+
+def combination_hand_scores():
+    """Benchmark for averaging the hand score of every keep over every shared card"""
+
+    computer, six_cards = dealt_computer("perfect")
+
+    full_deck = [i for i in computer.all_cards if i not in six_cards]
+    card_combinations = unique_combinations(six_cards, 4, 4)
+
+    def run():
+
+        computer.calculate_combination_hand_scores(card_combinations=card_combinations, full_deck=full_deck)
+
+    return run, 1
+
+
+def combination_crib_scores():
+    """Benchmark for averaging the crib score of every keep over every opponent discard and shared card"""
+
+    computer, six_cards = dealt_computer("perfect")
+
+    full_deck = [i for i in computer.all_cards if i not in six_cards]
+    card_combinations = unique_combinations(six_cards, 4, 4)
+
+    def run():
+
+        computer.calculate_combination_crib_scores(card_combinations=card_combinations, full_deck=full_deck)
+
+    return run, 1
+
+
+def deck_populate_shuffle_deal():
+    """Benchmark for building, shuffling and dealing a deck"""
+
+    random.seed(fixture_seed)
+
+    def run():
+
+        deck = Deck()
+        deck.populate()
+        deck.shuffle()
+        deck.deal(Hand(), Hand())
+
+    return run, 1
+
+
+def computer_discard(difficulty):
+    """Benchmark for a full Computer discard at a given difficulty"""
+
+    def create():
+
+        computer, six_cards = dealt_computer(difficulty)
+
+        def run():
+
+            # Discarding removes cards, so deal the same hand again each time
+            computer.hand.cards = list(six_cards)
+
+            computer.discard()
+
+        return run, 1
+
+    return create
+
+
+# Every benchmark, by name
+benchmark_cases = {
+    "score_hand_typical": score_hand_typical,
+    "score_hand_worst_case": score_hand_worst_case,
+    "unique_combinations_five_cards": unique_combinations_five_cards,
+    "unique_combinations_keeps": unique_combinations_keeps,
+    "unique_combinations_opponent_discards": unique_combinations_opponent_discards,
+    "combination_hand_scores": combination_hand_scores,
+    "combination_crib_scores": combination_crib_scores,
+    "deck_populate_shuffle_deal": deck_populate_shuffle_deal,
+    "computer_discard_easy": computer_discard("easy"),
+    "computer_discard_standard": computer_discard("standard"),
+    "computer_discard_hard": computer_discard("hard"),
+    "computer_discard_perfect": computer_discard("perfect")
+}
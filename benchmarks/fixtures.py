@@ -0,0 +1,77 @@
+"""Module for the fixed, seeded fixtures used by the benchmarks"""
+
+import random
+from cribbage import Deck, Hand, Computer
+from cribbage.card import Card
+
+
+# Seed used for every random fixture, so runs are comparable
+fixture_seed = 1234
+
+
+def full_deck():
+    """Function for building an unshuffled deck of cards"""
+
+    deck = Deck()
+    deck.populate()
+
+    return deck.cards
+
+
+def typical_hands(count=200):
+    """Function for dealing a fixed set of random four card hands with shared cards"""
+
+    rng = random.Random(fixture_seed)
+
+    hands = []
+
+    for _ in range(count):
+
+        cards = rng.sample(full_deck(), 5)
+
+        hand = Hand(is_crib=False)
+
+        for i in cards[:4]:
+
+            hand.add_card(i)
+
+        hands.append((hand, cards[4]))
+
+    return hands
+
+
+def worst_case_hand():
+    """Function for building the highest scoring hand: 5-5-5-J with the fourth 5 as the shared card"""
+
+    hand = Hand(is_crib=False)
+
+    for i in [Card("5", "H"), Card("5", "C"), Card("5", "D"), Card("J", "S")]:
+
+        hand.add_card(i)
+
+    return hand, Card("5", "S")
+
+
+def six_card_deal():
+    """Function for dealing a fixed six card hand, returning the hand and the full deck it came from"""
+
+    rng = random.Random(fixture_seed)
+
+    deck = full_deck()
+
+    return rng.sample(deck, 6), deck
+
+
+def dealt_computer(difficulty):
+    """Function for creating a Computer holding the fixed six card hand"""
+
+    six_cards, deck = six_card_deal()
+
+    computer = Computer(difficulty)
+    computer.add_cards_list(deck)
+
+    for i in six_cards:
+
+        computer.hand.add_card(i)
+
+    return computer, six_cards
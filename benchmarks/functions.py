@@ -0,0 +1,140 @@
+"""Module for running benchmarks and comparing them against a baseline"""
+
+import sys
+import json
+import platform
+import subprocess
+from time import perf_counter
+from benchmarks.cases import benchmark_cases
+
+
+def time_case(create_case, repeat, minimum_time):
+    """Function for timing a benchmark case, returning the best time per call"""
+
+    run, calls = create_case()
+
+    # Warm up so one-off costs such as building tables aren't timed
+    run()
+
+    # Find how many loops are needed for each repeat to take long enough to time reliably
+    loops = 1
+
+    while True:
+
+        start = perf_counter()
+
+        for _ in range(loops):
+
+            run()
+
+        elapsed = perf_counter() - start
+
+        if elapsed >= minimum_time:
+
+            break
+
+        loops *= 2
+
+    timings = [elapsed]
+
+    for _ in range(repeat - 1):
+
+        start = perf_counter()
+
+        for _ in range(loops):
+
+            run()
+
+        timings.append(perf_counter() - start)
+
+    # The fastest repeat is the one least disturbed by other work on the machine
+    return min(timings) / (loops * calls), loops * calls
+
+
+def run_benchmarks(names=None, repeat=5, minimum_time=0.2):
+    """Function for running benchmarks, returning machine-readable results"""
+
+    if names is None:
+
+        names = list(benchmark_cases)
+
+    benchmarks = {}
+
+    for i in names:
+
+        seconds_per_call, calls = time_case(create_case=benchmark_cases[i], repeat=repeat, minimum_time=minimum_time)
+
+        benchmarks[i] = {"seconds_per_call": seconds_per_call, "calls": calls}
+
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "benchmarks": benchmarks
+    }
+
+
+def measure_import_time(module="cribbage", repeat=5):
+    """Function for measuring the time taken to import a module in a fresh interpreter, in seconds"""
+
+    timings = []
+
+    for _ in range(repeat):
+
+        # Python reports the cumulative import time of each module, in microseconds, on standard error
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, check=True
+        )
+
+        for line in process.stderr.splitlines():
+
+            fields = [i.strip() for i in line.split("|")]
+
+            if len(fields) == 3 and fields[2] == module:
+
+                timings.append(int(fields[1]) / 1e6)
+
+    # The fastest import is the one least disturbed by other work on the machine
+    return min(timings)
+
+
+def compare_results(results, baseline, threshold=0.2):
+    """Function for comparing results against a baseline, returning each benchmark's ratio and any regressions"""
+
+    comparison = {}
+    regressions = []
+
+    for name, result in results["benchmarks"].items():
+
+        # Benchmarks without a baseline can't regress
+        if name not in baseline["benchmarks"]:
+
+            continue
+
+        ratio = result["seconds_per_call"] / baseline["benchmarks"][name]["seconds_per_call"]
+
+        comparison[name] = ratio
+
+        if ratio > 1 + threshold:
+
+            regressions.append(name)
+
+    return comparison, regressions
+
+
+def load_results(path):
+    """Function for loading results from a JSON file"""
+
+    with open(path) as results_file:
+
+        return json.load(results_file)
+
+
+def save_results(results, path):
+    """Function for saving results to a JSON file"""
+
+    with open(path, "w") as results_file:
+
+        json.dump(results, results_file, indent=4, sort_keys=True)
+
+    return
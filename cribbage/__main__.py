@@ -1,38 +1,120 @@
 """Main module for the cribbage package"""
 
+import sys
+import json
+import argparse
 from copy import copy
 from cribbage import Deck, Player, Computer
+from cribbage.analysis import analyze_stream
 
-# Build the deck
-deck = Deck()
-deck.populate()
-deck.shuffle()
 
-all_cards = copy(deck.cards)
+def play():
+    """Function for playing a round against the Computer"""
 
-player = Player("Tim")
-computer = Computer("hard")
+    # Build the deck
+    deck = Deck()
+    deck.populate()
+    deck.shuffle()
 
-computer.add_cards_list(all_cards)
+    all_cards = copy(deck.cards)
 
-player.give_crib()
+    player = Player("Tim")
+    computer = Computer("hard")
 
-deck.deal(player.hand, computer.hand)
+    computer.add_cards_list(all_cards)
 
-player_discards = player.discard()
-computer_discards = computer.discard()
+    player.give_crib()
 
-shared_card = deck.draw_card()
+    deck.deal(player.hand, computer.hand)
 
-print(shared_card.unicode)
-player.hand.display_cards()
-computer.hand.display_cards()
+    # The Computer scores its discard while the player chooses theirs
+    computer.start_discard()
 
-player_score = player.hand.score_hand(shared_card=shared_card)
-computer_score = computer.hand.score_hand(shared_card=shared_card)
+    try:
 
-print(player_score)
-print(computer_score)
+        player_discards = player.discard()
+        computer_discards = computer.discard()
 
-print([i.unicode for i in player_discards])
-print([i.unicode for i in computer_discards])
+    # Abandon the Computer's discard if the player quits
+    finally:
+
+        computer.close()
+
+    shared_card = deck.draw_card()
+
+    print(shared_card.unicode)
+    player.hand.display_cards()
+    computer.hand.display_cards()
+
+    player_score = player.hand.score_hand(shared_card=shared_card)
+    computer_score = computer.hand.score_hand(shared_card=shared_card)
+
+    print(player_score)
+    print(computer_score)
+
+    print([i.unicode for i in player_discards])
+    print([i.unicode for i in computer_discards])
+
+    return
+
+
+def analyze(arguments):
+    """Function for analysing hands read from a file or standard input, writing one JSON result per line"""
+
+    input_file = sys.stdin if arguments.input == "-" else open(arguments.input, encoding="utf-8")
+
+    try:
+
+        results = analyze_stream(
+            lines=input_file,
+            analysis=arguments.analysis,
+            is_crib=arguments.crib,
+            workers=arguments.workers,
+            chunk_size=arguments.chunk_size,
+            maximum_in_flight=arguments.maximum_in_flight,
+            discard_table_path=arguments.discard_table
+        )
+
+        for result in results:
+
+            sys.stdout.write(json.dumps(result) + "\n")
+
+    finally:
+
+        if input_file is not sys.stdin:
+
+            input_file.close()
+
+    return
+
+
+parser = argparse.ArgumentParser(prog="python -m cribbage", description="Play or analyse cribbage")
+subparsers = parser.add_subparsers(dest="command")
+
+subparsers.add_parser("play", help="Play a round against the Computer (the default)")
+
+analyze_parser = subparsers.add_parser(
+    "analyze", help="Analyse hands, one per line, such as \"5H 5C 5D JS 5S\" or \"5♥ 5♣ 5♦ J♠ 5♠\""
+)
+analyze_parser.add_argument("input", nargs="?", default="-", help="File of hands to analyse (default standard input)")
+analyze_parser.add_argument(
+    "--analysis", choices=["score", "breakdown", "discard"], default="score",
+    help="Score four cards and a shared card, break the score down, or find the best discard from six cards"
+)
+analyze_parser.add_argument("--crib", action="store_true", help="Score as a crib, or discard to your own crib")
+analyze_parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+analyze_parser.add_argument("--chunk-size", type=int, default=1000, help="Number of lines sent to a worker at once")
+analyze_parser.add_argument(
+    "--maximum-in-flight", type=int, default=None, help="Most chunks being analysed at once (default twice the workers)"
+)
+analyze_parser.add_argument("--discard-table", default=None, help="Precomputed discard table to look discards up in")
+
+command_arguments = parser.parse_args()
+
+if command_arguments.command == "analyze":
+
+    analyze(command_arguments)
+
+else:
+
+    play()
@@ -0,0 +1,3 @@
+"""__init__ module for the analysis package"""
+
+from cribbage.analysis.functions import parse_hand, analyze_line, analyze_lines, analyze_stream
@@ -0,0 +1,247 @@
+"""Module for analysing streams of hands, one hand per line"""
+
+import os
+from collections import deque
+from itertools import islice
+from cribbage.card import Card, cards_list, suits_list, parse_card
+from cribbage.deck import score_breakdown, unique_combinations
+
+
+# Number of cards expected on each line for each kind of analysis
+analysis_card_counts = {"score": 5, "breakdown": 5, "discard": 6}
+
+# Discard table opened by each worker process when it starts, shared by every chunk the worker analyses
+worker_discard_table = None
+
+
+def parse_hand(line):
+    """Function for converting a line of cards separated by spaces or commas into a list of cards"""
+
+    cards = [parse_card(i) for i in line.replace(",", " ").split()]
+
+    if len(set(cards)) != len(cards):
+
+        raise ValueError("A card appears more than once")
+
+    return cards
+
+
+def card_names(cards):
+    """Function for converting cards to rank and suit text, such as "10H" """
+
+    return [i.rank + i.suit for i in cards]
+
+
+def analyze_discard(hand_cards, has_crib, discard_table=None):
+    """Function for finding the average hand, crib and total scores of every combination of cards to keep"""
+
+    # Imported here as the player package is only needed for discards
+    from cribbage.player import Computer
+
+    computer = Computer("perfect")
+
+    # Every card not in the hand is unseen
+    computer.add_cards_list([Card(rank=j, suit=i) for i in suits_list for j in cards_list])
+
+    if discard_table is not None:
+
+        computer.add_discard_table(discard_table)
+
+    if has_crib:
+
+        computer.give_crib()
+
+    for i in hand_cards:
+
+        computer.hand.add_card(i)
+
+    full_deck = [i for i in computer.all_cards if i not in hand_cards]
+
+    card_combinations = unique_combinations(hand_cards, 4, 4)
+
+    hand_scores, crib_scores = computer.calculate_combination_scores(
+        card_combinations=card_combinations,
+        full_deck=full_deck
+    )
+
+    # Crib points count for the player if they have the crib, and against them otherwise
+    crib_sign = 1 if has_crib else -1
+
+    results = [
+        {
+            "keep": card_names(kept_cards),
+            "discard": card_names([i for i in hand_cards if i not in kept_cards]),
+            "hand_score": hand_score,
+            "crib_score": crib_score,
+            "total_score": hand_score + crib_sign * crib_score
+        }
+        for kept_cards, hand_score, crib_score in zip(card_combinations, hand_scores, crib_scores)
+    ]
+
+    return sorted(results, key=lambda x: x["total_score"], reverse=True)
+
+
+def analyze_line(line, analysis, is_crib=False, discard_table=None):
+    """Function for analysing a single line of cards, returning the result or the reason the line is invalid"""
+
+    try:
+
+        cards = parse_hand(line)
+
+        if len(cards) != analysis_card_counts[analysis]:
+
+            raise ValueError(f"Expected {analysis_card_counts[analysis]} cards, got {len(cards)}")
+
+    except ValueError as error:
+
+        return {"error": str(error)}
+
+    # The last card is the shared card
+    if analysis in ["score", "breakdown"]:
+
+        breakdown = score_breakdown(hand_cards=cards[:4], shared_card=cards[4], is_crib=is_crib)
+
+        result = {"hand": card_names(cards[:4]), "shared_card": card_names(cards[4:])[0]}
+
+        if analysis == "score":
+
+            result["score"] = breakdown.total
+
+        else:
+
+            result["breakdown"] = breakdown._asdict()
+
+        return result
+
+    combinations = analyze_discard(hand_cards=cards, has_crib=is_crib, discard_table=discard_table)
+
+    return {
+        "hand": card_names(cards),
+        "keep": combinations[0]["keep"],
+        "discard": combinations[0]["discard"],
+        "combinations": combinations
+    }
+
+
+def analyze_lines(numbered_lines, analysis, is_crib=False, discard_table=None):
+    """Function for analysing a chunk of numbered lines"""
+
+    results = []
+
+    for line_number, line in numbered_lines:
+
+        result = {"line": line_number}
+
+        result.update(analyze_line(line=line, analysis=analysis, is_crib=is_crib, discard_table=discard_table))
+
+        results.append(result)
+
+    return results
+
+
+def open_discard_table(discard_table_path, analysis):
+    """Function for opening a discard table if one is given and the analysis looks discards up"""
+
+    if discard_table_path is None or analysis != "discard":
+
+        return None
+
+    # Imported here as the player package is only needed for discards
+    from cribbage.player.discard_table import DiscardTable
+
+    return DiscardTable(discard_table_path)
+
+
+def start_worker(discard_table_path, analysis):
+    """Function for opening a worker process's discard table once, for use as a process pool initializer"""
+
+    global worker_discard_table
+
+    # The table stays open for the life of the worker and is closed when the process exits
+    worker_discard_table = open_discard_table(discard_table_path=discard_table_path, analysis=analysis)
+
+    return
+
+
+def analyze_worker_lines(numbered_lines, analysis, is_crib=False):
+    """Function for analysing a chunk of numbered lines in a worker process, using the worker's discard table"""
+
+    return analyze_lines(numbered_lines, analysis, is_crib, worker_discard_table)
+
+
+def numbered_chunks(lines, chunk_size):
+    """Function for lazily splitting lines into chunks of numbered lines, skipping blank lines"""
+
+    numbered_lines = ((i, line) for i, line in enumerate(lines, start=1) if line.strip())
+
+    while True:
+
+        chunk = list(islice(numbered_lines, chunk_size))
+
+        if not chunk:
+
+            return
+
+        yield chunk
+
+
+def analyze_stream(lines, analysis, is_crib=False, workers=None, chunk_size=1000, maximum_in_flight=None,
+                   discard_table_path=None):
+    """Function for lazily analysing lines across worker processes, generating the results in the order of the lines"""
+
+    if analysis not in analysis_card_counts:
+
+        raise ValueError("Invalid analysis choice")
+
+    if workers is None:
+
+        workers = os.cpu_count()
+
+    chunks = numbered_chunks(lines=lines, chunk_size=chunk_size)
+
+    # Without workers analyse each chunk in this process, opening the table once for every chunk
+    if workers <= 1:
+
+        discard_table = open_discard_table(discard_table_path=discard_table_path, analysis=analysis)
+
+        try:
+
+            for chunk in chunks:
+
+                yield from analyze_lines(chunk, analysis, is_crib, discard_table)
+
+        finally:
+
+            if discard_table is not None:
+
+                discard_table.close()
+
+        return
+
+    # Only a few chunks per worker are read ahead, so memory use doesn't depend on the size of the input
+    if maximum_in_flight is None:
+
+        maximum_in_flight = 2 * workers
+
+    # Imported here so the package starts quickly when no workers are used
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Each worker opens the table once when it starts rather than once per chunk
+    with ProcessPoolExecutor(
+            max_workers=workers, initializer=start_worker, initargs=(discard_table_path, analysis)
+    ) as executor:
+
+        in_flight = deque()
+
+        for chunk in chunks:
+
+            in_flight.append(executor.submit(analyze_worker_lines, chunk, analysis, is_crib))
+
+            # Wait for the oldest chunk before reading any more
+            if len(in_flight) >= maximum_in_flight:
+
+                yield from in_flight.popleft().result()
+
+        while in_flight:
+
+            yield from in_flight.popleft().result()
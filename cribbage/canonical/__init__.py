@@ -0,0 +1,5 @@
+"""__init__ module for the canonical package"""
+
+from cribbage.canonical.functions import canonical_key, canonical_hand_key, canonical_pegging_key, \
+    canonical_hands, canonical_combination_indices, apply_permutation, invert_permutation, masks_to_cards, \
+    pack_masks, unpack_masks
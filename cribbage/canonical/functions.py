@@ -0,0 +1,206 @@
+"""Module for relabelling suits so that equivalent hands share a canonical form"""
+
+from math import factorial
+from itertools import combinations, combinations_with_replacement, product
+from cribbage.card import Card, cards_list, suits_list
+
+
+# Number of bits used for the ranks of one suit
+mask_bits = len(cards_list)
+
+
+def suit_rank_masks(cards):
+    """Function for finding the ranks held in each suit, as a bit mask per suit"""
+
+    masks = dict.fromkeys(suits_list, 0)
+
+    for i in cards:
+
+        masks[i.suit] |= 1 << (i.order - 1)
+
+    return masks
+
+
+def signature_order(signature):
+    """Function for the sort key of a suit's signature - suits with more cards come first"""
+
+    return sum(i.bit_count() for i in signature), signature
+
+
+def canonicalise(signatures):
+    """Function for ordering suits by their signatures, returning the ordered signatures and suit permutation"""
+
+    # Suits with identical signatures are interchangeable, so ties can be broken in any way
+    ordered_suits = sorted(suits_list, key=lambda x: signature_order(signatures[x]), reverse=True)
+
+    # Map each original suit to the canonical suit at its position
+    permutation = {suit: suits_list[i] for i, suit in enumerate(ordered_suits)}
+
+    ordered_signatures = tuple(signatures[i] for i in ordered_suits)
+
+    return ordered_signatures, permutation
+
+
+def canonical_key(hand, starter=None, known_cards=None):
+    """Function for finding the canonical key of a hand, with an optional starter and other known cards"""
+
+    groups = [hand, [] if starter is None else [starter], [] if known_cards is None else known_cards]
+
+    group_masks = [suit_rank_masks(i) for i in groups]
+
+    # Each suit is described by the ranks it holds in each group
+    signatures = {suit: tuple(i[suit] for i in group_masks) for suit in suits_list}
+
+    return canonicalise(signatures)
+
+
+def canonical_hand_key(hand):
+    """Function for finding the canonical key of a hand alone, packed into a single integer"""
+
+    masks = suit_rank_masks(hand)
+
+    ordered_masks, permutation = canonicalise({suit: (masks[suit],) for suit in suits_list})
+
+    return pack_masks([i[0] for i in ordered_masks]), permutation
+
+
+def canonical_pegging_key(hand, played_cards, starter=None):
+    """Function for finding the canonical key of a pegging state: a hand and the ordered cards played so far"""
+
+    hand_masks = suit_rank_masks(hand)
+    starter_masks = suit_rank_masks([] if starter is None else [starter])
+
+    # The order of play matters, so played cards are described by their positions in each suit
+    played_masks = dict.fromkeys(suits_list, 0)
+
+    for i, card in enumerate(played_cards):
+
+        played_masks[card.suit] |= 1 << i
+
+    signatures = {suit: (hand_masks[suit], played_masks[suit], starter_masks[suit]) for suit in suits_list}
+
+    ordered_signatures, permutation = canonicalise(signatures)
+
+    # The ranks played don't depend on the suits
+    played_orders = tuple(i.order for i in played_cards)
+
+    return (played_orders, ordered_signatures), permutation
+
+
+def apply_permutation(cards, permutation):
+    """Function for relabelling the suits of cards using a permutation"""
+
+    return [Card(rank=i.rank, suit=permutation[i.suit]) for i in cards]
+
+
+def invert_permutation(permutation):
+    """Function for inverting a permutation, to map canonical cards back to the original suits"""
+
+    return {canonical_suit: suit for suit, canonical_suit in permutation.items()}
+
+
+def canonical_combination_indices(cards, permutation, length):
+    """Function for matching each combination of cards in canonical order to the same combination in original order"""
+
+    # Canonical order sorts cards by their relabelled suit and then by order
+    canonical_order = sorted(
+        range(len(cards)),
+        key=lambda x: (suits_list.index(permutation[cards[x].suit]), cards[x].order)
+    )
+
+    positions_list = list(combinations(range(len(cards)), length))
+
+    original_index = {positions: i for i, positions in enumerate(positions_list)}
+
+    return [original_index[tuple(sorted(canonical_order[j] for j in positions))] for positions in positions_list]
+
+
+def pack_masks(masks):
+    """Function for packing four suit masks into a single integer"""
+
+    key = 0
+
+    for i in masks:
+
+        key = (key << mask_bits) | i
+
+    return key
+
+
+def unpack_masks(key):
+    """Function for unpacking an integer into four suit masks"""
+
+    mask_limit = (1 << mask_bits) - 1
+
+    return tuple((key >> (mask_bits * i)) & mask_limit for i in reversed(range(len(suits_list))))
+
+
+def masks_to_cards(masks):
+    """Function for converting canonical suit masks into a list of cards"""
+
+    return [
+        Card(rank=rank, suit=suit)
+        for suit, mask in zip(suits_list, masks)
+        for i, rank in enumerate(cards_list)
+        if mask & (1 << i)
+    ]
+
+
+def canonical_hands(size):
+    """Function for generating every canonical hand of a given size, with the number of hands it represents"""
+
+    # Masks of ranks for a single suit, grouped by how many cards they hold
+    masks_by_count = [
+        sorted((sum(1 << i for i in ranks) for ranks in combinations(range(mask_bits), count)), reverse=True)
+        for count in range(min(size, mask_bits) + 1)
+    ]
+
+    # Split the cards between suits with non-increasing counts - canonical order puts fuller suits first
+    for counts in partitions(size, len(suits_list)):
+
+        # Suits holding the same number of cards must also be in decreasing mask order
+        count_groups = [(count, counts.count(count)) for count in sorted(set(counts), reverse=True)]
+
+        group_choices = [
+            combinations_with_replacement(masks_by_count[count], repeats) for count, repeats in count_groups
+        ]
+
+        for choice in product(*group_choices):
+
+            masks = tuple(mask for group in choice for mask in group)
+
+            # The number of distinct ways to assign these masks to the four suits
+            multiplicity = factorial(len(masks))
+
+            for i in set(masks):
+
+                multiplicity //= factorial(masks.count(i))
+
+            yield masks, multiplicity
+
+
+def partitions(total, parts, largest=None):
+    """Function for generating non-increasing lists of a fixed number of parts summing to a total"""
+
+    if largest is None:
+
+        largest = total
+
+    if parts == 0:
+
+        if total == 0:
+
+            yield ()
+
+        return
+
+    for i in range(min(total, largest), -1, -1):
+
+        # The remaining parts can't hold more than this part each
+        if i * parts < total:
+
+            break
+
+        for rest in partitions(total - i, parts - 1, i):
+
+            yield (i,) + rest
@@ -1,3 +1,3 @@
 """__init__ module for the card package"""
 
-from cribbage.card.define_card import Card, cards_list, suits_list
+from cribbage.card.define_card import Card, cards_list, suits_list, rank_values, card_to_id, id_to_card, parse_card
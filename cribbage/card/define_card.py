@@ -10,17 +10,63 @@ cards_list = ace + non_face_cards + face_cards
 # List suits
 suits_list = ["H", "C", "D", "S"]
 
+suit_unicode_characters = {
+
+    "S": u"\u2660",
+    "H": u"\u2665",
+    "D": u"\u2666",
+    "C": u"\u2663"
+
+}
+
+face_card_orders = {
+
+    "J": 11,
+    "Q": 12,
+    "K": 13
+
+}
+
+# There is only ever one instance of each card, looked up by rank and suit
+interned_cards = {}
+
 
 class Card:
     """Class for a playing card"""
 
-    def __init__(self, rank="2", suit="S"):
+    __slots__ = ("rank", "suit", "value", "order", "unicode", "id", "bit")
+
+    def __new__(cls, rank="2", suit="S"):
+
+        # Return the existing card if there is one
+        try:
+
+            return interned_cards[(rank, suit)]
+
+        except KeyError:
+
+            pass
+
+        card = super().__new__(cls)
+
+        card.rank = rank
+        card.suit = suit
+        card.value = cls.set_value(rank=rank)
+        card.order = cls.set_order(rank=rank)
+        card.unicode = cls.set_unicode(rank=rank, suit=suit)
+
+        # Cards are numbered from 0 to 51 by rank and then suit
+        card.id = (card.order - 1) * len(suits_list) + suits_list.index(suit)
+        card.bit = 1 << card.id
+
+        interned_cards[(rank, suit)] = card
 
-        self.rank = rank
-        self.suit = suit
-        self.value = self.set_value(rank=rank)
-        self.order = self.set_order(rank=rank)
-        self.unicode = self.set_unicode(rank=rank, suit=suit)
+        return card
+
+    def __reduce__(self):
+
+        # Copies and unpickled cards resolve to the same instance
+        return Card, (self.rank, self.suit)
 
     @staticmethod
     def set_value(rank):
@@ -51,15 +97,6 @@ class Card:
     def set_unicode(rank, suit):
         """Method for setting the unicode representation of a card"""
 
-        suit_unicode_characters = {
-
-            "S": u"\u2660",
-            "H": u"\u2665",
-            "D": u"\u2666",
-            "C": u"\u2663"
-
-        }
-
         try:
 
             suit_unicode = suit_unicode_characters[suit]
@@ -89,17 +126,9 @@ class Card:
         # Face cards have order J, Q, K
         elif rank in face_cards:
 
-            order_dict = {
-
-                "J": 11,
-                "Q": 12,
-                "K": 13
-
-            }
-
             try:
 
-                order = order_dict[rank]
+                order = face_card_orders[rank]
 
             except KeyError:
 
@@ -117,6 +146,49 @@ class Card:
         print(self.unicode)
 
 
+# Value of each rank, in the order of the cards list
+rank_values = [Card.set_value(rank=i) for i in cards_list]
+
+
+# Create every card up front, in order of id
+cards_by_id = sorted((Card(rank=j, suit=i) for i in suits_list for j in cards_list), key=lambda x: x.id)
+
+
+def card_to_id(card):
+    """Function for converting a card to an id from 0 to 51, ordered by rank and then suit"""
+
+    return card.id
+
+
+def id_to_card(card_id):
+    """Function for converting an id from 0 to 51 back to a card"""
+
+    return cards_by_id[card_id]
+
+
+# Suits can be written as letters or as their unicode characters
+suit_names = dict(zip(suits_list, suits_list), **{j: i for i, j in suit_unicode_characters.items()})
+
+
+def parse_card(text):
+    """Function for converting text such as "10H", "TH" or the card's unicode into a card"""
+
+    text = text.strip().upper()
+
+    rank, suit = text[:-1], text[-1:]
+
+    # Ten can be written as a single character
+    if rank == "T":
+
+        rank = "10"
+
+    if rank not in cards_list or suit not in suit_names:
+
+        raise ValueError(f"Invalid card {text!r}")
+
+    return Card(rank=rank, suit=suit_names[suit])
+
+
 if __name__ == "__main__":
 
     print(face_cards)
@@ -1,4 +1,26 @@
 """__init__ module for the deck package"""
 
+from importlib import import_module
 from cribbage.deck.define_deck import Deck, Hand
-from cribbage.deck.functions import unique_combinations
+from cribbage.deck.functions import unique_combinations, iter_unique_combinations
+from cribbage.deck.card_mask import cards_to_mask, mask_to_cards, iter_mask, count_mask, full_deck_mask
+from cribbage.deck.score_table import score_breakdown, ScoreBreakdown
+
+
+# Functions needing NumPy or worker processes are only imported when first used, so the package starts quickly
+lazy_functions = {
+    "score_hands_batch": "cribbage.deck.batch_scoring",
+    "cards_to_ids": "cribbage.deck.batch_scoring",
+    "deal_many": "cribbage.deck.dealing",
+    "split_deals": "cribbage.deck.dealing",
+    "hand_space_statistics": "cribbage.deck.hand_statistics"
+}
+
+
+def __getattr__(name):
+
+    if name not in lazy_functions:
+
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(import_module(lazy_functions[name]), name)
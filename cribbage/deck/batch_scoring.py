@@ -0,0 +1,86 @@
+"""Module for scoring many hands at once using arrays of card ids"""
+
+import numpy
+from cribbage.card import cards_list, suits_list, rank_values, card_to_id
+
+
+# Every non-empty subset of five cards, one row per subset
+subset_matrix = numpy.array([[(i >> j) & 1 for j in range(5)] for i in range(1, 32)])
+
+# Value of each rank index
+rank_value_array = numpy.array(rank_values)
+
+jack_index = cards_list.index("J")
+
+
+def cards_to_ids(cards):
+    """Function for converting a list of cards, or a list of hands of cards, to an array of card ids"""
+
+    # A single list of cards
+    if len(cards) == 0 or not isinstance(cards[0], (list, tuple)):
+
+        return numpy.array([card_to_id(i) for i in cards], dtype=numpy.int64)
+
+    return numpy.array([[card_to_id(i) for i in hand] for hand in cards], dtype=numpy.int64)
+
+
+def score_hands_batch(card_ids, starter_index=4, is_crib=False):
+    """Function for scoring an array of five card hands, with the shared card in the given column"""
+
+    card_ids = numpy.asarray(card_ids, dtype=numpy.int64)
+
+    if card_ids.ndim != 2 or card_ids.shape[1] != 5:
+
+        raise ValueError("Card ids must have shape (N, 5)")
+
+    ranks, suits = numpy.divmod(card_ids, len(suits_list))
+
+    # Count all fifteens (worth 2 each) by summing the values of every subset
+    subset_sums = rank_value_array[ranks] @ subset_matrix.T
+
+    scores = (subset_sums == 15).sum(axis=1) * 2
+
+    # Count how many of each rank appear in each hand
+    rank_counts = (ranks[:, :, None] == numpy.arange(len(cards_list))).sum(axis=1)
+
+    # Count all pairs (worth 2 each) - n cards of a rank make n choose 2 pairs
+    scores += (rank_counts * (rank_counts - 1)).sum(axis=1)
+
+    # Pad the counts so every run has an empty rank either side of it
+    padded_counts = numpy.pad(rank_counts, ((0, 0), (1, 1)))
+
+    # Count runs of cards - a run scores its length once for each way of picking one card of each rank
+    for run_length in (3, 4, 5):
+
+        for start in range(1, len(cards_list) - run_length + 2):
+
+            window = padded_counts[:, start:start + run_length]
+
+            is_run = (
+                (window > 0).all(axis=1)
+                & (padded_counts[:, start - 1] == 0)
+                & (padded_counts[:, start + run_length] == 0)
+            )
+
+            scores += numpy.where(is_run, run_length * window.prod(axis=1), 0)
+
+    # Separate the hand cards from the shared card
+    hand_columns = [i for i in range(5) if i != starter_index]
+
+    hand_ranks = ranks[:, hand_columns]
+    hand_suits = suits[:, hand_columns]
+    shared_ranks = ranks[:, starter_index]
+    shared_suits = suits[:, starter_index]
+
+    # Count flushes - crib hand can only score on a five card flush
+    four_card_flush = (hand_suits == hand_suits[:, :1]).all(axis=1)
+    five_card_flush = four_card_flush & (shared_suits == hand_suits[:, 0])
+
+    scores += numpy.where(five_card_flush, 5, numpy.where(four_card_flush & ~numpy.asarray(is_crib), 4, 0))
+
+    # Count nobs - a Jack with the same suit as the shared card, unless the shared card is a Jack
+    nobs = ((hand_ranks == jack_index) & (hand_suits == shared_suits[:, None])).sum(axis=1)
+
+    scores += numpy.where(shared_ranks == jack_index, 0, nobs)
+
+    return scores
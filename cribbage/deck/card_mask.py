@@ -0,0 +1,44 @@
+"""Module for representing sets of cards as 52-bit integer masks"""
+
+from cribbage.card import id_to_card
+
+
+# Mask holding every card in the deck
+full_deck_mask = (1 << 52) - 1
+
+
+def cards_to_mask(cards):
+    """Function for converting a list of cards to a mask"""
+
+    mask = 0
+
+    for i in cards:
+
+        mask |= i.bit
+
+    return mask
+
+
+def iter_mask(mask):
+    """Function for generating the cards in a mask, in order of id"""
+
+    while mask:
+
+        # Isolate the lowest set bit
+        lowest_bit = mask & -mask
+
+        yield id_to_card(lowest_bit.bit_length() - 1)
+
+        mask ^= lowest_bit
+
+
+def mask_to_cards(mask):
+    """Function for converting a mask to a list of cards, in order of id"""
+
+    return list(iter_mask(mask))
+
+
+def count_mask(mask):
+    """Function for counting the cards in a mask"""
+
+    return mask.bit_count()
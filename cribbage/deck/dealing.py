@@ -0,0 +1,28 @@
+"""Module for dealing many shuffled decks at once"""
+
+import numpy as np
+from cribbage.card import cards_list, suits_list
+
+
+# Cards are dealt alternately, pone first, then the shared card is cut from the rest of the deck
+deal_size = 6
+pone_columns = list(range(0, 2 * deal_size, 2))
+dealer_columns = list(range(1, 2 * deal_size, 2))
+shared_card_column = 2 * deal_size
+
+
+def deal_many(count, seed=None):
+    """Function for shuffling many decks at once, returning a matrix with a permutation of the card ids in each row"""
+
+    rng = np.random.default_rng(seed)
+
+    deck_size = len(cards_list) * len(suits_list)
+
+    # Sorting rows of random keys gives an independent uniform permutation for each deck
+    return np.argsort(rng.random((count, deck_size)), axis=1).astype(np.uint8)
+
+
+def split_deals(decks):
+    """Function for splitting a matrix of decks into the pone's, dealer's and shared card ids of each deal"""
+
+    return decks[:, pone_columns], decks[:, dealer_columns], decks[:, shared_card_column]
@@ -1,18 +1,91 @@
 """Module for defining a deck of cards"""
 
-from random import shuffle
+import random
 from operator import itemgetter
 from itertools import groupby
-from cribbage.card import Card, cards_list, suits_list
+from cribbage.card import Card, cards_list, suits_list, id_to_card
 from cribbage.deck.functions import unique_combinations
+from cribbage.deck.card_mask import cards_to_mask, mask_to_cards, count_mask
+from cribbage.instrumentation import instrumented
+from cribbage.deck.score_table import score_five_cards, score_all_shared_cards, score_breakdown, flush_suit, \
+    flush_points, nobs_points
 
 
 class Deck:
     """Class for a deck of cards"""
 
-    def __init__(self):
+    def __init__(self, use_mask=False, rng=None):
 
-        self.cards = []
+        # A deck is either an ordered list of cards or an unordered mask of card bits
+        self.use_mask = use_mask
+        self.card_list = []
+        self.card_mask = 0
+
+        # Cards are drawn by moving a cursor along the list rather than removing them
+        self.top = 0
+
+        # Shuffle with the global random module, a given random number generator or a new one from a seed
+        if rng is None:
+
+            self.rng = random
+
+        # Anything that can shuffle, such as a random.Random instance or the random module, is used as it is
+        elif hasattr(rng, "shuffle"):
+
+            self.rng = rng
+
+        elif isinstance(rng, int):
+
+            self.rng = random.Random(rng)
+
+        else:
+
+            raise ValueError("Invalid random number generator or seed")
+
+    @property
+    def cards(self):
+        """List of the cards in the deck - for a mask-backed deck, a new list in order of id"""
+
+        if self.use_mask:
+
+            return mask_to_cards(self.card_mask)
+
+        self.compact_cards()
+
+        return self.card_list
+
+    @cards.setter
+    def cards(self, cards):
+
+        if self.use_mask:
+
+            self.card_mask = cards_to_mask(cards)
+
+        else:
+
+            self.card_list = cards
+            self.top = 0
+
+    def compact_cards(self):
+        """Method for dropping cards already drawn from the front of the list"""
+
+        if self.top:
+
+            del self.card_list[:self.top]
+
+            self.top = 0
+
+        return
+
+    @property
+    def mask(self):
+        """Mask of the cards in the deck"""
+
+        if self.use_mask:
+
+            return self.card_mask
+
+        return cards_to_mask(self.cards)
 
     def populate(self):
         """Method for populating a deck of cards"""
@@ -34,49 +107,98 @@ class Deck:
     def count_cards(self):
         """Method for counting the number of cards in a deck"""
 
-        return len(self.cards)
+        if self.use_mask:
+
+            return count_mask(self.card_mask)
+
+        return len(self.card_list) - self.top
+
+    def has_card(self, card):
+        """Method for checking whether a card is in a deck"""
+
+        if self.use_mask:
+
+            return self.card_mask & card.bit != 0
+
+        return card in self.cards
 
     def add_card(self, card):
         """Method for adding a card to a deck"""
 
-        self.cards.append(card)
+        if self.use_mask:
+
+            self.card_mask |= card.bit
+
+        else:
+
+            self.card_list.append(card)
 
         return
 
     def remove_card(self, card):
         """Method for removing a card from a deck"""
 
-        self.cards.remove(card)
+        if self.use_mask:
+
+            # Match the error raised when removing a missing card from a list
+            if not self.card_mask & card.bit:
+
+                raise ValueError("Card is not in the deck")
+
+            self.card_mask ^= card.bit
+
+        else:
+
+            self.cards.remove(card)
 
         return
 
     def shuffle(self):
         """Method for shuffling a deck of cards"""
 
+        if self.use_mask:
+
+            raise ValueError("A mask-backed deck has no order to shuffle")
+
         # Get the cards
         cards = self.cards
 
         # Shuffle
-        shuffle(cards)
+        self.rng.shuffle(cards)
 
         # Update the deck
         self.cards = cards
 
         return
 
+    def load_ids(self, card_ids):
+        """Method for filling a deck with cards in the order of their ids, such as a row from deal_many"""
+
+        self.cards = [id_to_card(int(i)) for i in card_ids]
+
+        return
+
     def draw_card(self):
         """Method for drawing a card"""
 
         # If there are no cards left, return None
-        if len(self.cards) == 0:
+        if self.count_cards() == 0:
 
             return None
 
-        # Get the top card from the deck
-        card = self.cards[0]
+        # Remove the lowest card from a mask-backed deck, isolating its bit without building the list of cards
+        if self.use_mask:
+
+            lowest_bit = self.card_mask & -self.card_mask
+
+            self.card_mask ^= lowest_bit
+
+            return id_to_card(lowest_bit.bit_length() - 1)
+
+        # Take the top card and move the cursor past it
+        card = self.card_list[self.top]
 
-        # Remove the card from the deck
-        self.cards.remove(card)
+        self.top += 1
 
         return card
 
@@ -127,9 +249,9 @@ class Deck:
 class Hand(Deck):
     """Class for a player's hand"""
 
-    def __init__(self, is_crib=False):
+    def __init__(self, is_crib=False, use_mask=False):
 
-        super().__init__()
+        super().__init__(use_mask=use_mask)
         self.is_crib = is_crib
         self.combinations = []
 
@@ -287,99 +409,58 @@ class Hand(Deck):
         return runs_of_three, runs_of_four, runs_of_five
 
     def count_flushes(self, shared_card):
-        """Method for counting flushes in a hand"""
+        """Method for counting four and five card flushes in a hand, using the same rules as the scoring functions"""
 
-        four_card_flush = 0
-        five_card_flush = 0
-
-        # Get the suits of all cards excluding the shared card
-        hand_suits = [i.suit for i in self.cards if i != shared_card]
-
-        # Get the unique set of suits
-        suits_set = list(set(hand_suits))
-
-        # If there is only one suit in the hand
-        if len(suits_set) == 1:
-
-            # If the shared card has the same suit, it's a five card flush
-            if shared_card.suit in suits_set:
-
-                five_card_flush += 1
-
-            # Otherwise it's a four card flush
-            else:
-
-                # Crib hand can only score on a five card flush
-                if not self.is_crib:
-
-                    four_card_flush += 1
+        # Get the suit shared by all cards excluding the shared card, if there is one
+        points = flush_points(
+            flush_suit([i for i in self.cards if i != shared_card]), shared_card=shared_card, is_crib=self.is_crib
+        )
 
-        return four_card_flush, five_card_flush
+        return int(points == 4), int(points == 5)
 
     def count_nobs(self, shared_card):
-        """Method for counting nobs in a hand"""
+        """Method for counting nobs in a hand, using the same rules as the scoring functions"""
 
-        nobs = 0
-
-        # Get the rank and suit of the shared card
-        shared_rank = shared_card.rank
-        shared_suit = shared_card.suit
-
-        # If the shared card is a Jack, player can't receive points for nob so return
-        if shared_rank == "J":
-
-            return nobs
-
-        # Otherwise loop through the cards in the hand
-        for i in self.cards:
-
-            card_rank = i.rank
-            card_suit = i.suit
-
-            # If card is a Jack and has the same suit as the shared card, add one
-            if card_rank == "J" and card_suit == shared_suit:
-
-                nobs += 1
-
-        return nobs
+        return nobs_points([i.suit for i in self.cards if i.rank == "J"], shared_card=shared_card)
 
+    @instrumented("score_hand")
     def score_hand(self, shared_card):
-        """Method for scoring a hand"""
+        """Method for scoring a hand with a shared card, without adding the shared card to the hand"""
+
+        # A full hand can be scored using the precomputed rank table
+        if self.count_cards() == 4:
 
-        score = 0
+            return score_five_cards(hand_cards=self.cards, shared_card=shared_card, is_crib=self.is_crib)
 
-        # Add shared card to hand
-        self.add_card(shared_card)
+        return self.score_breakdown(shared_card=shared_card).total
 
-        # Find all unique combinations of cards in the hand
-        self.unique_card_combinations()
+    def score_breakdown(self, shared_card):
+        """Method for scoring a hand with a shared card, returning the points from each kind of scoring group"""
 
-        # Count all fifteens (worth 2 each)
-        fifteens = self.count_fifteens()
+        return score_breakdown(hand_cards=self.cards, shared_card=shared_card, is_crib=self.is_crib)
 
-        score += fifteens * 2
+    def score_all_starters(self, candidates, histogram=False):
+        """Method for scoring a four card hand with each possible shared card, without changing the hand"""
 
-        # Count all pairs (worth 2 each)
-        pairs = self.count_pairs()
+        if len(self.cards) != 4:
 
-        score += pairs * 2
+            raise ValueError("Hand must have four cards to score against shared cards")
 
-        # Count runs of cards
-        runs_of_three, runs_of_four, runs_of_five = self.count_runs()
+        scores = score_all_shared_cards(hand_cards=self.cards, shared_cards=candidates, is_crib=self.is_crib)
 
-        score += runs_of_three * 3 + runs_of_four * 4 + runs_of_five * 5
+        # Optionally count how many times each score occurs instead
+        if histogram:
 
-        # Count flushes
-        four_card_flush, five_card_flush = self.count_flushes(shared_card=shared_card)
+            # 29 is the highest possible score
+            score_counts = [0] * 30
 
-        score += four_card_flush * 4 + five_card_flush * 5
+            for i in scores:
 
-        # Count nobs
-        nobs = self.count_nobs(shared_card=shared_card)
+                score_counts[i] += 1
 
-        score += nobs
+            return score_counts
 
-        return score
+        return scores
 
 
 if __name__ == "__main__":
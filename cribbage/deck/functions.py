@@ -1,26 +1,24 @@
 """Module for retrieving unique combinations of cards"""
 
-from itertools import combinations
+from itertools import chain, combinations
+from cribbage.instrumentation import instrumented
 
 
-def unique_combinations(card_list, minimum_length, maximum_length):
-    """Function for retrieving unique combinations of cards of a given length"""
-
-    # Find all combinations of cards of in specified length range
-    card_combinations = [list(combinations(card_list, i)) for i in range(minimum_length, maximum_length + 1)]
+def iter_unique_combinations(card_list, minimum_length, maximum_length):
+    """Function for lazily generating unique combinations of cards of a given length"""
 
-    # Flatten into a single list
-    card_combinations_flat = [item for sublist in card_combinations for item in sublist]
+    # A card appearing more than once would produce repeated subsets, so keep only its first position
+    # Combinations of distinct positions are then distinct subsets i.e (K♥, 7♦) == (7♦, K♥) is never produced
+    distinct_cards = list(dict.fromkeys(card_list))
 
-    # Deduplicate i.e (K♥, 7♦) == (7♦, K♥)
-    card_combinations_deduped = []
+    # Generate combinations by position, shortest first, in the same order as itertools.combinations
+    return chain.from_iterable(
+        combinations(distinct_cards, i) for i in range(minimum_length, maximum_length + 1)
+    )
 
-    # Loop through every element of the list
-    for i in card_combinations_flat:
 
-        # If the set of objects in the element is already in the de-duped list, don't add
-        if set(i) not in [set(j) for j in card_combinations_deduped]:
-            # Otherwise, add the element
-            card_combinations_deduped.append(i)
+@instrumented("unique_combinations")
+def unique_combinations(card_list, minimum_length, maximum_length):
+    """Function for retrieving unique combinations of cards of a given length"""
 
-    return card_combinations_deduped
+    return list(iter_unique_combinations(card_list, minimum_length, maximum_length))
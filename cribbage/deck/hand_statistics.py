@@ -0,0 +1,262 @@
+"""Module for calculating score statistics over every four card hand and shared card"""
+
+import os
+import json
+import argparse
+from itertools import combinations, count, islice
+from multiprocessing import Pool
+from cribbage.card import cards_list, suits_list, id_to_card
+from cribbage.files import write_atomically
+from cribbage.canonical import canonical_hands, masks_to_cards
+from cribbage.deck.score_table import score_all_shared_cards
+
+
+# Scores are counted in a histogram - 29 is the highest possible score
+score_count = 30
+
+# Hands are scored both as a player's hand and as a crib, which only scores five card flushes
+variants = {"hand": False, "crib": True}
+
+# Names of the patterns of repeated ranks in four cards
+rank_pattern_names = {
+    (1, 1, 1, 1): "no pair",
+    (2, 1, 1): "pair",
+    (2, 2): "two pair",
+    (3, 1): "three of a kind",
+    (4,): "four of a kind"
+}
+
+# Every card in the deck, in order of id
+cards_by_id = [id_to_card(i) for i in range(len(cards_list) * len(suits_list))]
+
+# Version of the checkpoint file - bump it if the checkpoint contents change
+checkpoint_version = 1
+
+
+def keep_type(hand_cards):
+    """Function for describing a hand by its pattern of repeated ranks and how its cards are split between suits"""
+
+    rank_counts = {}
+    suit_counts = {}
+
+    for i in hand_cards:
+
+        rank_counts[i.rank] = rank_counts.get(i.rank, 0) + 1
+        suit_counts[i.suit] = suit_counts.get(i.suit, 0) + 1
+
+    rank_pattern = rank_pattern_names[tuple(sorted(rank_counts.values(), reverse=True))]
+    suit_pattern = "-".join(str(i) for i in sorted(suit_counts.values(), reverse=True))
+
+    return f"{rank_pattern}, {suit_pattern} suits"
+
+
+def enumerate_hands(canonical):
+    """Function for generating the ids of the cards in every four card hand, with the number of hands each represents"""
+
+    # Hands with suits relabelled are equivalent, so each canonical hand stands for all of its relabellings
+    if canonical:
+
+        for masks, multiplicity in canonical_hands(4):
+
+            yield tuple(i.id for i in masks_to_cards(masks)), multiplicity
+
+    else:
+
+        for i in combinations(range(len(cards_by_id)), 4):
+
+            yield i, 1
+
+
+def hand_chunks(canonical, chunk_size):
+    """Function for lazily splitting the enumerated hands into chunks, each with the index of its first hand"""
+
+    # The hands are enumerated once, with each chunk sent to a worker holding its own hands
+    hands = enumerate_hands(canonical)
+
+    for start in count(0, chunk_size):
+
+        chunk = list(islice(hands, chunk_size))
+
+        if not chunk:
+
+            return
+
+        yield start, chunk
+
+
+def empty_histograms():
+    """Function for creating empty histograms for each variant"""
+
+    return {variant: {} for variant in variants}
+
+
+def merge_histograms(totals, histograms):
+    """Function for adding the counts in one set of histograms to another"""
+
+    for variant, type_histograms in histograms.items():
+
+        for type_name, histogram in type_histograms.items():
+
+            total = totals[variant].setdefault(type_name, [0] * score_count)
+
+            for i, count in enumerate(histogram):
+
+                total[i] += count
+
+    return totals
+
+
+def score_hand_chunk(start, hands):
+    """Function for scoring a chunk of hands, as card ids and multiplicities, with every shared card in a worker"""
+
+    histograms = empty_histograms()
+
+    for hand_ids, multiplicity in hands:
+
+        hand_cards = [cards_by_id[i] for i in hand_ids]
+
+        shared_cards = [i for i in cards_by_id if i.id not in hand_ids]
+
+        type_name = keep_type(hand_cards)
+
+        for variant, is_crib in variants.items():
+
+            histogram = histograms[variant].setdefault(type_name, [0] * score_count)
+
+            # Each score counts once for every hand the enumerated hand stands for
+            for score in score_all_shared_cards(hand_cards=hand_cards, shared_cards=shared_cards, is_crib=is_crib):
+
+                histogram[score] += multiplicity
+
+    return start, histograms
+
+
+def score_hand_chunk_task(task):
+    """Function for scoring a chunk from a single task tuple, for use with imap_unordered"""
+
+    return score_hand_chunk(*task)
+
+
+def load_checkpoint(path, canonical, chunk_size):
+    """Function for loading the chunks completed so far and their histograms, if a matching checkpoint exists"""
+
+    if path is None or not os.path.exists(path):
+
+        return set(), empty_histograms()
+
+    with open(path) as checkpoint_file:
+
+        checkpoint = json.load(checkpoint_file)
+
+    # Chunks only line up if the hands were enumerated and split the same way
+    if (checkpoint["version"], checkpoint["canonical"], checkpoint["chunk_size"]) != (
+            checkpoint_version, canonical, chunk_size):
+
+        raise ValueError("Checkpoint was written by a run with different settings")
+
+    return set(checkpoint["completed"]), checkpoint["histograms"]
+
+
+def save_checkpoint(path, canonical, chunk_size, completed, histograms):
+    """Function for saving the chunks completed so far and their histograms"""
+
+    checkpoint = {
+        "version": checkpoint_version,
+        "canonical": canonical,
+        "chunk_size": chunk_size,
+        "completed": sorted(completed),
+        "histograms": histograms
+    }
+
+    # An interrupted run never leaves a partial checkpoint
+    with write_atomically(path) as checkpoint_file:
+
+        json.dump(checkpoint, checkpoint_file)
+
+    return
+
+
+def summarise_histogram(histogram):
+    """Function for finding the number of scores, mean and maximum of a histogram"""
+
+    count = sum(histogram)
+
+    return {
+        "count": count,
+        "mean": sum(i * j for i, j in enumerate(histogram)) / count,
+        "maximum": max(i for i, j in enumerate(histogram) if j),
+        "histogram": histogram
+    }
+
+
+def summarise_histograms(histograms):
+    """Function for summarising the histograms of each variant by keep type and overall"""
+
+    summary = {}
+
+    for variant, type_histograms in histograms.items():
+
+        overall = [sum(i) for i in zip(*type_histograms.values())]
+
+        summary[variant] = {
+            "all": summarise_histogram(overall),
+            "keep_types": {i: summarise_histogram(type_histograms[i]) for i in sorted(type_histograms)}
+        }
+
+    return summary
+
+
+def hand_space_statistics(canonical=True, workers=None, chunk_size=1000, checkpoint_path=None):
+    """Function for scoring every four card hand with every shared card across worker processes, returning statistics"""
+
+    completed, histograms = load_checkpoint(path=checkpoint_path, canonical=canonical, chunk_size=chunk_size)
+
+    # Chunks are identified by their first hand, so a resumed run only scores the chunks not yet completed
+    tasks = (i for i in hand_chunks(canonical=canonical, chunk_size=chunk_size) if i[0] not in completed)
+
+    with Pool(processes=workers) as pool:
+
+        # Only the running totals are kept, so memory use doesn't grow with the number of chunks
+        for start, chunk_histograms in pool.imap_unordered(score_hand_chunk_task, tasks):
+
+            merge_histograms(histograms, chunk_histograms)
+
+            completed.add(start)
+
+            if checkpoint_path is not None:
+
+                save_checkpoint(
+                    path=checkpoint_path, canonical=canonical, chunk_size=chunk_size, completed=completed,
+                    histograms=histograms
+                )
+
+    return summarise_histograms(histograms)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Calculate score statistics over every four card hand and shared card")
+    parser.add_argument("--full", action="store_true", help="Enumerate every hand rather than one of each suit pattern")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Number of hands scored in each chunk")
+    parser.add_argument("--checkpoint", default=None, help="File to save progress to and resume from")
+    parser.add_argument("--output", default=None, help="File to write the statistics to (default standard output)")
+
+    arguments = parser.parse_args()
+
+    statistics = hand_space_statistics(
+        canonical=not arguments.full,
+        workers=arguments.workers,
+        chunk_size=arguments.chunk_size,
+        checkpoint_path=arguments.checkpoint
+    )
+
+    if arguments.output is None:
+
+        print(json.dumps(statistics, indent=4))
+
+    else:
+
+        with open(arguments.output, "w") as output_file:
+
+            json.dump(statistics, output_file, indent=4)
@@ -0,0 +1,288 @@
+"""Module for the precomputed table of rank-based hand scores"""
+
+import os
+import json
+from collections import namedtuple
+from itertools import combinations_with_replacement
+from cribbage.card import Card, cards_list, suits_list
+from cribbage.files import write_atomically
+
+
+# Fifteens, pairs and runs depend only on the multiset of ranks in a hand
+# Giving each order a prime means the product of the primes uniquely identifies the multiset
+order_primes = [None, 2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+# Name of the cached table - bump the version if the table contents change
+table_file_name = "rank_scores_v3.json"
+
+# Tables are loaded lazily on first use
+_rank_score_table = None
+_rank_component_table = None
+
+# Breakdown of a hand's score, with counts of each kind of scoring group and the total points
+ScoreBreakdown = namedtuple(
+    "ScoreBreakdown", ["fifteens", "pairs", "runs_of_three", "runs_of_four", "runs_of_five", "flush", "nobs", "total"]
+)
+
+
+def cache_directory():
+    """Function for finding the directory used to cache precomputed tables"""
+
+    # Allow the location to be overridden, otherwise use the user's cache directory
+    directory = os.environ.get("CRIBBAGE_CACHE_DIR")
+
+    if directory is None:
+
+        directory = os.path.join(os.path.expanduser("~"), ".cache", "cribbage")
+
+    return directory
+
+
+def rank_key(cards):
+    """Function for calculating the rank multiset key of a list of cards"""
+
+    key = 1
+
+    for i in cards:
+
+        key *= order_primes[i.order]
+
+    return key
+
+
+def rank_multisets():
+    """Function for generating every multiset of five ranks that can be dealt"""
+
+    # Loop through every multiset of five ranks
+    for ranks in combinations_with_replacement(cards_list, 5):
+
+        # There are only four cards of each rank
+        if any(ranks.count(i) > 4 for i in ranks):
+
+            continue
+
+        yield ranks
+
+
+def rank_multiset_keys():
+    """Function for finding the key of every multiset of five ranks that can be dealt"""
+
+    return [rank_key(Card(rank=i, suit=suits_list[0]) for i in ranks) for ranks in rank_multisets()]
+
+
+def build_rank_score_table():
+    """Function for building the tables of fifteen, pair and run points and counts for every five card rank multiset"""
+
+    table = {}
+    component_table = {}
+
+    for ranks in rank_multisets():
+
+        # Give repeated ranks different suits so each card is distinct
+        cards = [Card(rank=rank, suit=suits_list[ranks[:i].count(rank)]) for i, rank in enumerate(ranks)]
+
+        components = count_rank_components(cards)
+
+        key = rank_key(cards)
+
+        table[key] = component_points(*components)
+        component_table[key] = components
+
+    return table, component_table
+
+
+def count_rank_components(cards):
+    """Function for counting the fifteens, pairs and runs of each length in any number of cards"""
+
+    # Imported here as the deck module depends on this one
+    from cribbage.deck.define_deck import Hand
+
+    hand = Hand(is_crib=False)
+
+    for i in cards:
+
+        hand.add_card(i)
+
+    hand.unique_card_combinations()
+
+    return (hand.count_fifteens(), hand.count_pairs()) + hand.count_runs()
+
+
+def component_points(fifteens, pairs, runs_of_three, runs_of_four, runs_of_five):
+    """Function for converting counts of fifteens, pairs and runs into points"""
+
+    return fifteens * 2 + pairs * 2 + runs_of_three * 3 + runs_of_four * 4 + runs_of_five * 5
+
+
+def flush_suit(hand_cards):
+    """Function for finding the suit shared by all the hand cards, or None if they don't all share one"""
+
+    hand_suits = {i.suit for i in hand_cards}
+
+    return hand_suits.pop() if len(hand_suits) == 1 else None
+
+
+def flush_points(hand_suit, shared_card, is_crib):
+    """Function for scoring a flush, given the suit shared by all the hand cards or None"""
+
+    # Flushes need all the hand cards to share a suit
+    if hand_suit is None:
+
+        return 0
+
+    # If the shared card has the same suit, it's a five card flush
+    if shared_card.suit == hand_suit:
+
+        return 5
+
+    # Crib hand can only score on a five card flush
+    return 0 if is_crib else 4
+
+
+def nobs_points(jack_suits, shared_card):
+    """Function for scoring nobs, given the suits of the Jacks in the hand"""
+
+    # Nobs can't be scored if the shared card is a Jack
+    if not jack_suits or shared_card.rank == "J":
+
+        return 0
+
+    return jack_suits.count(shared_card.suit)
+
+
+def load_rank_score_table():
+    """Function for loading the rank score tables from the cache, building and caching them if needed"""
+
+    table_path = os.path.join(cache_directory(), table_file_name)
+
+    # The cache is plain data, so a file placed in the cache directory can't run code when it's read
+    try:
+
+        with open(table_path) as table_file:
+
+            rows = json.load(table_file)
+
+        tables = ({i[0]: i[1] for i in rows}, {i[0]: tuple(i[2:]) for i in rows})
+
+        # A cache that isn't a complete table is rebuilt
+        if all(len(i) == 7 for i in rows) and set(tables[0]) == set(rank_multiset_keys()):
+
+            return tables
+
+    except (OSError, ValueError, TypeError, IndexError):
+
+        pass
+
+    tables = build_rank_score_table()
+
+    table, component_table = tables
+
+    # Each row holds the key, the points and then the fifteen, pair and run counts
+    rows = [[key, table[key], *component_table[key]] for key in sorted(table)]
+
+    try:
+
+        os.makedirs(os.path.dirname(table_path), exist_ok=True)
+
+        with write_atomically(table_path) as table_file:
+
+            json.dump(rows, table_file)
+
+    # If the cache can't be written the tables are still usable in memory
+    except OSError:
+
+        pass
+
+    return tables
+
+
+def get_rank_score_table():
+    """Function for retrieving the rank score table, loading it on first use"""
+
+    global _rank_score_table, _rank_component_table
+
+    if _rank_score_table is None:
+
+        _rank_score_table, _rank_component_table = load_rank_score_table()
+
+    return _rank_score_table
+
+
+def get_rank_component_table():
+    """Function for retrieving the table of fifteen, pair and run counts, loading it on first use"""
+
+    get_rank_score_table()
+
+    return _rank_component_table
+
+
+def score_five_cards(hand_cards, shared_card, is_crib):
+    """Function for scoring four hand cards and a shared card using the rank score table"""
+
+    first_card, second_card, third_card, fourth_card = hand_cards
+
+    # Fifteens, pairs and runs come straight from the table
+    score = get_rank_score_table()[
+        order_primes[first_card.order]
+        * order_primes[second_card.order]
+        * order_primes[third_card.order]
+        * order_primes[fourth_card.order]
+        * order_primes[shared_card.order]
+    ]
+
+    # Flushes and nobs depend on the suits - the flush suit is found without building a set as this is the hot path
+    suit = first_card.suit
+
+    if second_card.suit == suit and third_card.suit == suit and fourth_card.suit == suit:
+
+        score += flush_points(suit, shared_card, is_crib)
+
+    # Most hands have no Jacks, so the list of their suits is only built when needed
+    if "J" in (first_card.rank, second_card.rank, third_card.rank, fourth_card.rank):
+
+        score += nobs_points([i.suit for i in hand_cards if i.rank == "J"], shared_card)
+
+    return score
+
+
+def score_all_shared_cards(hand_cards, shared_cards, is_crib):
+    """Function for scoring four hand cards with each of a list of possible shared cards"""
+
+    table = get_rank_score_table()
+
+    # Everything about the hand cards is the same for every shared card, so work it out once
+    hand_key = rank_key(hand_cards)
+
+    hand_suit = flush_suit(hand_cards)
+
+    jack_suits = [i.suit for i in hand_cards if i.rank == "J"]
+
+    scores = [table[hand_key * order_primes[i.order]] for i in shared_cards]
+
+    # Most hands have neither a flush nor a Jack, so only the hands that do are adjusted
+    if hand_suit is not None or jack_suits:
+
+        scores = [
+            score + flush_points(hand_suit, shared_card, is_crib) + nobs_points(jack_suits, shared_card)
+            for score, shared_card in zip(scores, shared_cards)
+        ]
+
+    return scores
+
+
+def score_breakdown(hand_cards, shared_card, is_crib=False):
+    """Function for scoring hand cards and a shared card without changing them, returning a breakdown of the score"""
+
+    # A full hand has its fifteens, pairs and runs in the table, otherwise count them directly
+    if len(hand_cards) == 4:
+
+        components = get_rank_component_table()[rank_key(hand_cards) * order_primes[shared_card.order]]
+
+    else:
+
+        components = count_rank_components(list(hand_cards) + [shared_card])
+
+    flush = flush_points(flush_suit(hand_cards), shared_card, is_crib)
+    nobs = nobs_points([i.suit for i in hand_cards if i.rank == "J"], shared_card)
+
+    return ScoreBreakdown(*components, flush, nobs, component_points(*components) + flush + nobs)
@@ -0,0 +1,3 @@
+"""__init__ module for the files package"""
+
+from cribbage.files.functions import write_atomically
@@ -0,0 +1,27 @@
+"""Module for functions shared by the modules that write tables, caches and checkpoints to files"""
+
+import os
+from contextlib import contextmanager
+
+
+@contextmanager
+def write_atomically(path, mode="w"):
+    """Function for writing a file through a temporary file that replaces it once complete, yielding the open file"""
+
+    # Readers, and other processes writing the same file, never see a partly written file
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+
+    try:
+
+        with open(temporary_path, mode) as temporary_file:
+
+            yield temporary_file
+
+        os.replace(temporary_path, path)
+
+    # Don't leave the temporary file behind if writing fails
+    finally:
+
+        if os.path.exists(temporary_path):
+
+            os.remove(temporary_path)
@@ -0,0 +1,5 @@
+"""__init__ module for the game package"""
+
+from cribbage.game.define_game import GameEngine
+from cribbage.game.functions import simulate_games, computer_players
+from cribbage.game.game_log import GameLogWriter, GameLogReader, event_names
@@ -0,0 +1,245 @@
+"""Module for defining a headless game of cribbage"""
+
+import random
+from cribbage.deck import Deck, Hand
+from cribbage.pegging import PeggingState
+from cribbage.game.game_log import event_deal, event_discard, event_starter, event_play, event_go, event_show, \
+    event_crib, event_win
+
+
+class GameEngine:
+    """Class for playing complete games of cribbage between two players without any input or output"""
+
+    def __init__(self, first_player, second_player, rng=None, game_log=None):
+
+        self.players = [first_player, second_player]
+        self.rng = random.Random() if rng is None else rng
+        self.hands_played = 0
+
+        # Optionally record every event to a game log, numbering games on from any already in the log
+        self.game_log = game_log
+        self.games_played = 0
+
+    def log_event(self, event, player, card=None, points=0):
+        """Method for recording an event in the game log, if there is one"""
+
+        if self.game_log is not None:
+
+            self.game_log.write(
+                game=self.game_log.first_game + self.games_played,
+                event=event,
+                player=self.players.index(player),
+                card=card,
+                points=points
+            )
+
+        return
+
+    def award(self, player, points, event, card=None):
+        """Method for adding points to a player's score and logging the event, returning whether they have won"""
+
+        # Only the points up to 121 count, so the points in the log add up to the final scores
+        points = min(points, 121 - player.score)
+
+        # A go after thirty-one scores nothing, and the thirty-one was already logged with its play
+        if event != event_go or points > 0:
+
+            self.log_event(event=event, player=player, card=card, points=points)
+
+        if points > 0:
+
+            player.add_to_score(points)
+
+        return player.has_won()
+
+    def play_game(self):
+        """Method for playing a game until a player reaches 121, returning the result"""
+
+        for i in self.players:
+
+            i.score = 0
+
+        self.hands_played = 0
+
+        # Cut for the first deal
+        dealer_index = self.rng.randrange(2)
+
+        while True:
+
+            dealer = self.players[dealer_index]
+            pone = self.players[1 - dealer_index]
+
+            self.hands_played += 1
+
+            if self.play_hand(dealer=dealer, pone=pone):
+
+                break
+
+            # Deal alternates between players
+            dealer_index = 1 - dealer_index
+
+        winner = 0 if self.players[0].has_won() else 1
+
+        self.log_event(event=event_win, player=self.players[winner])
+
+        self.games_played += 1
+
+        return {
+            "winner": winner,
+            "scores": [i.score for i in self.players],
+            "hands": self.hands_played
+        }
+
+    def play_hand(self, dealer, pone):
+        """Method for playing a single hand, returning whether the game has been won"""
+
+        # Build and shuffle the deck
+        deck = Deck(rng=self.rng)
+        deck.populate()
+        deck.shuffle()
+
+        all_cards = list(deck.cards)
+
+        dealer.give_crib()
+        pone.remove_crib()
+
+        for i in [dealer, pone]:
+
+            i.hand = Hand(is_crib=False)
+
+            # Computer players use the full list of cards to make decisions
+            if hasattr(i, "add_cards_list"):
+
+                i.add_cards_list(all_cards)
+
+        deck.deal(dealer.hand, pone.hand)
+
+        # Remember the cards each player was dealt, as players know their own discards
+        dealt_cards = {dealer: list(dealer.hand.cards), pone: list(pone.hand.cards)}
+
+        for player in [pone, dealer]:
+
+            for i in dealt_cards[player]:
+
+                self.log_event(event=event_deal, player=player, card=i)
+
+        # Both players discard to the dealer's crib
+        crib = Hand(is_crib=True)
+
+        for player in [pone, dealer]:
+
+            for i in player.discard():
+
+                crib.add_card(i)
+
+                self.log_event(event=event_discard, player=player, card=i)
+
+        shared_card = deck.draw_card()
+
+        # If the shared card is a Jack the dealer scores 2 for his heels
+        heels = 2 if shared_card.rank == "J" else 0
+
+        if self.award(dealer, heels, event=event_starter, card=shared_card):
+
+            return True
+
+        if self.play_pegging(dealer=dealer, pone=pone, all_cards=all_cards, dealt_cards=dealt_cards,
+                             shared_card=shared_card):
+
+            return True
+
+        # The pone shows first, then the dealer, then the crib
+        for player, hand, event in [(pone, pone.hand, event_show), (dealer, dealer.hand, event_show),
+                                    (dealer, crib, event_crib)]:
+
+            points = hand.score_hand(shared_card=shared_card)
+
+            if self.award(player, points, event=event):
+
+                return True
+
+        return False
+
+    def play_pegging(self, dealer, pone, all_cards, dealt_cards, shared_card):
+        """Method for playing the pegging phase of a hand, returning whether the game has been won"""
+
+        cards_left = {pone: list(pone.hand.cards), dealer: list(dealer.hand.cards)}
+
+        # Cards a player hasn't seen could be held by their opponent
+        unseen_cards = {
+            i: [card for card in all_cards if card not in dealt_cards[i] and card is not shared_card]
+            for i in [dealer, pone]
+        }
+
+        pegging_state = PeggingState()
+        last_player = None
+
+        # Whether a player has said go, so their opponent plays on alone until the count ends
+        go_said = False
+
+        # The pone plays first
+        player, other_player = pone, dealer
+
+        while cards_left[pone] or cards_left[dealer]:
+
+            playable_cards = [i for i in cards_left[player] if pegging_state.can_play(i)]
+
+            # If the player can't play, the other player continues if they can
+            if not playable_cards:
+
+                if any(pegging_state.can_play(i) for i in cards_left[other_player]):
+
+                    player, other_player = other_player, player
+
+                    go_said = True
+
+                    continue
+
+                # Neither player can play, so the last player to play scores 1 for the go
+                points = pegging_state.end_count()
+
+                if self.award(last_player, points, event=event_go):
+
+                    return True
+
+                # The player after the last player to play starts the next count
+                player, other_player = (pone, dealer) if last_player is dealer else (dealer, pone)
+
+                go_said = False
+
+                continue
+
+            card = player.choose_play(
+                playable_cards=playable_cards,
+                pegging_state=pegging_state,
+                cards_left=cards_left[player],
+                unseen_cards=unseen_cards[player],
+                opponent_card_count=len(cards_left[other_player]),
+                opponent_stuck=go_said
+            )
+
+            cards_left[player].remove(card)
+
+            # The card has now been seen by the other player
+            unseen_cards[other_player].remove(card)
+            last_player = player
+
+            points = pegging_state.play(card)
+
+            if self.award(player, points, event=event_play, card=card):
+
+                return True
+
+            # Reaching thirty-one starts a new count
+            if pegging_state.count == 31:
+
+                pegging_state.end_count()
+
+                go_said = False
+
+            player, other_player = other_player, player
+
+        # The last card played scores 1, unless it made thirty-one
+        points = pegging_state.end_count()
+
+        return self.award(last_player, points, event=event_go)
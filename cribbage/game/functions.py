@@ -0,0 +1,85 @@
+"""Module for simulating many games of cribbage across worker processes"""
+
+import os
+import random
+from functools import partial
+from multiprocessing import Pool
+from cribbage.player import Computer
+from cribbage.game.define_game import GameEngine
+from cribbage.game.game_log import GameLogWriter
+
+
+def computer_players(first_difficulty="hard", second_difficulty="hard", **computer_options):
+    """Function for creating a pair of Computer players"""
+
+    # A time limit on pegging searches would make results depend on the speed of the machine
+    # Hard searches to their full depth in well under a second per game, while perfect takes tens of seconds per game
+    computer_options.setdefault("play_time_limit", None)
+
+    return Computer(first_difficulty, **computer_options), Computer(second_difficulty, **computer_options)
+
+
+def simulate_chunk(player_factory, games, seed, log_path=None):
+    """Function for playing a number of games with a seeded random number generator, for use in a worker process"""
+
+    # Computer decisions use the random module, so seed it as well as the engine
+    random.seed(seed)
+
+    game_log = None if log_path is None else GameLogWriter(log_path)
+
+    engine = GameEngine(*player_factory(), rng=random.Random(seed), game_log=game_log)
+
+    wins = [0, 0]
+    hands = 0
+    margin = 0
+
+    for _ in range(games):
+
+        result = engine.play_game()
+
+        wins[result["winner"]] += 1
+        hands += result["hands"]
+        margin += abs(result["scores"][0] - result["scores"][1])
+
+    if game_log is not None:
+
+        game_log.close()
+
+    return {"games": games, "wins": wins, "hands": hands, "margin": margin}
+
+
+def simulate_games(games, player_factory=computer_players, workers=None, seed=0, chunk_size=100, log_directory=None):
+    """Function for simulating games across worker processes, returning the combined results"""
+
+    if workers is None:
+
+        workers = os.cpu_count()
+
+    # Every chunk of games gets its own seed so results are reproducible however the chunks are scheduled
+    chunk_games = [min(chunk_size, games - i) for i in range(0, games, chunk_size)]
+    chunk_seeds = [f"{seed}:{i}" for i in range(len(chunk_games))]
+
+    # Each chunk optionally logs its games to its own file, so workers never share a file
+    if log_directory is None:
+
+        chunk_log_paths = [None] * len(chunk_games)
+
+    else:
+
+        os.makedirs(log_directory, exist_ok=True)
+
+        chunk_log_paths = [os.path.join(log_directory, f"games_{seed}_{i:05d}.log") for i in range(len(chunk_games))]
+
+    totals = {"games": 0, "wins": [0, 0], "hands": 0, "margin": 0}
+
+    with Pool(processes=workers) as pool:
+
+        for i in pool.starmap(partial(simulate_chunk, player_factory), zip(chunk_games, chunk_seeds, chunk_log_paths)):
+
+            totals["games"] += i["games"]
+            totals["wins"][0] += i["wins"][0]
+            totals["wins"][1] += i["wins"][1]
+            totals["hands"] += i["hands"]
+            totals["margin"] += i["margin"]
+
+    return totals
@@ -0,0 +1,208 @@
+"""Module for writing and reading compact binary logs of the events in games"""
+
+import os
+import mmap
+import struct
+
+
+# File layout: a header, then fixed-width records of one event each
+# Each record holds the game number, the kind of event, the player it belongs to, a card id and the points scored
+header_format = "<8sII"
+header_size = struct.calcsize(header_format)
+magic = b"CRIBLOG1"
+log_version = 1
+
+record_format = "<IBBBB"
+record_struct = struct.Struct(record_format)
+record_size = record_struct.size
+
+# Card ids fit in 6 bits, so the largest 6 bit value marks an event without a card
+no_card = 63
+
+# Kinds of event, in the order they happen in a hand
+event_deal = 0
+event_discard = 1
+event_starter = 2
+event_play = 3
+event_go = 4
+event_show = 5
+event_crib = 6
+event_win = 7
+
+event_names = ["deal", "discard", "starter", "play", "go", "show", "crib", "win"]
+
+
+def record_dtype():
+    """Function for creating the NumPy structured type matching a record"""
+
+    # Imported here so NumPy is only loaded when logs are read
+    import numpy
+
+    return numpy.dtype([
+        ("game", "<u4"),
+        ("event", "u1"),
+        ("player", "u1"),
+        ("card", "u1"),
+        ("points", "u1")
+    ])
+
+
+def read_last_game(path):
+    """Function for checking an existing game log can be appended to, returning the number of its last game or None"""
+
+    with open(path, "rb") as log_file:
+
+        header = log_file.read(header_size)
+
+        if len(header) < header_size or struct.unpack(header_format, header) != (magic, log_version, record_size):
+
+            raise ValueError("Not a game log file")
+
+        log_file.seek(0, os.SEEK_END)
+
+        records_size = log_file.tell() - header_size
+
+        # Appending after a partly written record would misalign every record that follows
+        if records_size % record_size:
+
+            raise ValueError("Game log ends with a partly written record")
+
+        if records_size == 0:
+
+            return None
+
+        log_file.seek(-record_size, os.SEEK_END)
+
+        return record_struct.unpack(log_file.read(record_size))[0]
+
+
+class GameLogWriter:
+    """Class for writing events to a game log through a buffer"""
+
+    def __init__(self, path, buffer_records=65536, append=False):
+
+        self.path = path
+        self.buffer_records = buffer_records
+        self.buffer = bytearray()
+        self.buffered = 0
+
+        # Games are numbered from zero in a new log, or carry on from the last game of a log being appended to
+        self.first_game = 0
+
+        if append and os.path.exists(path):
+
+            last_game = read_last_game(path)
+
+            self.first_game = 0 if last_game is None else last_game + 1
+
+            self.log_file = open(path, "ab")
+
+        # Otherwise any existing file is replaced, so a log only ever holds one run of games
+        else:
+
+            self.log_file = open(path, "wb")
+
+            self.log_file.write(struct.pack(header_format, magic, log_version, record_size))
+
+    def write(self, game, event, player, card=None, points=0):
+        """Method for adding an event to the log"""
+
+        self.buffer += record_struct.pack(game, event, player, no_card if card is None else card.id, points)
+
+        self.buffered += 1
+
+        if self.buffered >= self.buffer_records:
+
+            self.flush()
+
+        return
+
+    def flush(self):
+        """Method for writing the buffered events to the file"""
+
+        if self.buffer:
+
+            self.log_file.write(self.buffer)
+
+            self.buffer = bytearray()
+            self.buffered = 0
+
+        self.log_file.flush()
+
+        return
+
+    def close(self):
+        """Method for writing any buffered events and closing the file"""
+
+        if not self.log_file.closed:
+
+            self.flush()
+
+            self.log_file.close()
+
+        return
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+
+        self.close()
+
+
+class GameLogReader:
+    """Class for reading a game log through a memory map, as a NumPy structured array of records"""
+
+    def __init__(self, path):
+
+        # Imported here so NumPy is only loaded when logs are read
+        import numpy
+
+        self.path = path
+
+        # An empty map can't be created, so a log must at least have a header
+        if os.path.getsize(path) < header_size:
+
+            raise ValueError("Not a game log file")
+
+        with open(path, "rb") as log_file:
+
+            self.map = mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        file_magic, version, file_record_size = struct.unpack_from(header_format, self.map)
+
+        if file_magic != magic or version != log_version or file_record_size != record_size:
+
+            raise ValueError("Not a game log file")
+
+        # Ignore a partly written record at the end of a log still being written
+        record_count = (len(self.map) - header_size) // record_size
+
+        # The array reads straight from the map without copying
+        self.records = numpy.frombuffer(self.map, dtype=record_dtype(), count=record_count, offset=header_size)
+
+    def __len__(self):
+
+        return len(self.records)
+
+    def events(self, event):
+        """Method for selecting the records of one kind of event, by name"""
+
+        return self.records[self.records["event"] == event_names.index(event)]
+
+    def close(self):
+        """Method for releasing the records and closing the memory map"""
+
+        self.records = None
+
+        # If arrays taken from the records are still in use, the map is closed once they are freed
+        try:
+
+            self.map.close()
+
+        except BufferError:
+
+            pass
+
+        return
@@ -0,0 +1,5 @@
+"""__init__ module for the instrumentation package"""
+
+from cribbage.instrumentation.define_instrumentation import Instrumentation, instrumentation
+from cribbage.instrumentation.functions import instrumented, enable_instrumentation, disable_instrumentation, \
+    reset_instrumentation, instrumentation_snapshot, instrument, save_instrumentation, profile_call
@@ -0,0 +1,90 @@
+"""Module for defining counters and timers of the functions on the scoring and decision paths"""
+
+from bisect import bisect_left
+
+
+# Upper bounds of the decision latency histogram buckets, in seconds - slower decisions go in a final bucket
+latency_bucket_bounds = [0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0]
+
+
+class Instrumentation:
+    """Class for collecting call counts, call times, decision latencies and cache hit rates while enabled"""
+
+    def __init__(self):
+
+        self.enabled = False
+        self.calls = {}
+        self.seconds = {}
+        self.latencies = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def reset(self):
+        """Method for clearing everything collected so far"""
+
+        self.calls = {}
+        self.seconds = {}
+        self.latencies = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        return
+
+    def record_call(self, name, seconds, decision=False):
+        """Method for recording a call to an instrumented function and the time it took"""
+
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+        # Decisions also have the distribution of their latencies recorded
+        if decision:
+
+            histogram = self.latencies.setdefault(name, [0] * (len(latency_bucket_bounds) + 1))
+
+            histogram[bisect_left(latency_bucket_bounds, seconds)] += 1
+
+        return
+
+    def record_cache_lookup(self, hit):
+        """Method for recording whether a cache lookup found an entry"""
+
+        if hit:
+
+            self.cache_hits += 1
+
+        else:
+
+            self.cache_misses += 1
+
+        return
+
+    def snapshot(self):
+        """Method for reporting everything collected so far"""
+
+        lookups = self.cache_hits + self.cache_misses
+
+        bucket_names = [f"<={i}" for i in latency_bucket_bounds] + [f">{latency_bucket_bounds[-1]}"]
+
+        return {
+            "enabled": self.enabled,
+            "functions": {
+                i: {
+                    "calls": self.calls[i],
+                    "total_seconds": self.seconds[i],
+                    "mean_seconds": self.seconds[i] / self.calls[i]
+                }
+                for i in sorted(self.calls)
+            },
+            "decision_latencies": {
+                i: dict(zip(bucket_names, histogram)) for i, histogram in sorted(self.latencies.items())
+            },
+            "cache": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "hit_rate": self.cache_hits / lookups if lookups else None
+            }
+        }
+
+
+# Instrumentation shared by the whole package, off by default
+instrumentation = Instrumentation()
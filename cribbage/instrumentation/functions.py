@@ -0,0 +1,112 @@
+"""Module for functions to instrument, switch on and report on the scoring and decision paths"""
+
+import json
+from time import perf_counter
+from functools import wraps
+from contextlib import contextmanager
+from cribbage.instrumentation.define_instrumentation import instrumentation
+
+
+def instrumented(name, decision=False):
+    """Function for creating a decorator that counts and times calls to a function while instrumentation is enabled"""
+
+    def decorator(function):
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+
+            # When disabled the only cost is checking the flag
+            if not instrumentation.enabled:
+
+                return function(*args, **kwargs)
+
+            start = perf_counter()
+
+            try:
+
+                return function(*args, **kwargs)
+
+            finally:
+
+                instrumentation.record_call(name=name, seconds=perf_counter() - start, decision=decision)
+
+        return wrapper
+
+    return decorator
+
+
+def enable_instrumentation():
+    """Function for switching instrumentation on"""
+
+    instrumentation.enabled = True
+
+    return
+
+
+def disable_instrumentation():
+    """Function for switching instrumentation off, keeping everything collected so far"""
+
+    instrumentation.enabled = False
+
+    return
+
+
+def reset_instrumentation():
+    """Function for clearing everything collected so far"""
+
+    instrumentation.reset()
+
+    return
+
+
+def instrumentation_snapshot():
+    """Function for reporting everything collected so far"""
+
+    return instrumentation.snapshot()
+
+
+@contextmanager
+def instrument(reset=True):
+    """Function for collecting instrumentation within a with block, yielding the instrumentation to snapshot"""
+
+    was_enabled = instrumentation.enabled
+
+    if reset:
+
+        instrumentation.reset()
+
+    instrumentation.enabled = True
+
+    try:
+
+        yield instrumentation
+
+    finally:
+
+        instrumentation.enabled = was_enabled
+
+
+def save_instrumentation(path):
+    """Function for writing a snapshot of everything collected so far to a JSON file"""
+
+    with open(path, "w") as snapshot_file:
+
+        json.dump(instrumentation.snapshot(), snapshot_file, indent=4)
+
+    return
+
+
+def profile_call(function, path, *args, **kwargs):
+    """Function for running a single call, such as a Computer decision, under cProfile and saving the statistics"""
+
+    # Imported here as profiling is rarely needed
+    import cProfile
+
+    profiler = cProfile.Profile()
+
+    result = profiler.runcall(function, *args, **kwargs)
+
+    # The statistics can be read with the pstats module or tools such as snakeviz
+    profiler.dump_stats(path)
+
+    return result
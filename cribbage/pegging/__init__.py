@@ -0,0 +1,3 @@
+"""__init__ module for the pegging package"""
+
+from cribbage.pegging.define_pegging import PeggingState
@@ -0,0 +1,121 @@
+"""Module for defining the state of the pegging phase of a hand"""
+
+
+class PeggingState:
+    """Class for the running count and cards played during pegging, scored incrementally as cards are played"""
+
+    def __init__(self):
+
+        self.count = 0
+        self.cards = []
+        self.same_rank = 0
+        self.history = []
+
+        # Masks of the orders of the last one, two, three... cards played, for as long as the orders are distinct
+        # There are at most 13 distinct orders, so the state never holds more than 13 masks
+        self.run_masks = []
+
+    def can_play(self, card):
+        """Method for checking whether a card can be played without the count going over 31"""
+
+        return self.count + card.value <= 31
+
+    def play(self, card):
+        """Method for playing a card, returning the points it scores"""
+
+        # Remember what's needed to undo the play
+        self.history.append((card, (self.same_rank, self.run_masks)))
+
+        # Count cards of the same rank played in a row
+        if self.cards and self.cards[-1].order == card.order:
+
+            self.same_rank += 1
+
+        else:
+
+            self.same_rank = 1
+
+        self.cards.append(card)
+        self.count += card.value
+
+        # Extend the previous masks with the new card, stopping at the first one already holding its order
+        # A new list is built so the previous one can be restored by undo
+        bit = 1 << card.order
+
+        run_masks = [bit]
+
+        for i in self.run_masks:
+
+            if i & bit:
+
+                break
+
+            run_masks.append(i | bit)
+
+        self.run_masks = run_masks
+
+        score = 0
+
+        # Reaching fifteen or thirty-one scores 2
+        if self.count == 15 or self.count == 31:
+
+            score += 2
+
+        # A pair scores 2, three of a kind scores 6 and four of a kind scores 12
+        score += self.same_rank * (self.same_rank - 1)
+
+        # A pair can't be part of a run, so only look for runs when the last two ranks differ
+        if self.same_rank == 1:
+
+            score += self.run_length()
+
+        return score
+
+    def run_length(self):
+        """Method for finding the length of the longest run, of three or more, formed by the last cards played"""
+
+        run_masks = self.run_masks
+
+        # The longest mask whose orders form a single block of bits is the longest run
+        for i in range(len(run_masks) - 1, 1, -1):
+
+            mask = run_masks[i]
+
+            if (mask + (mask & -mask)) & mask == 0:
+
+                return i + 1
+
+        return 0
+
+    def end_count(self):
+        """Method for ending the current count, returning the point for the go or last card"""
+
+        self.history.append((None, (self.cards, self.count, self.same_rank, self.run_masks)))
+
+        # Thirty-one already scored when the card was played
+        score = 1 if 0 < self.count < 31 else 0
+
+        self.cards = []
+        self.count = 0
+        self.same_rank = 0
+        self.run_masks = []
+
+        return score
+
+    def undo(self):
+        """Method for undoing the last card played or count ended"""
+
+        card, saved_state = self.history.pop()
+
+        # Restore an ended count
+        if card is None:
+
+            self.cards, self.count, self.same_rank, self.run_masks = saved_state
+
+        else:
+
+            self.cards.pop()
+            self.count -= card.value
+            self.same_rank, self.run_masks = saved_state
+
+        return
@@ -1,3 +1,4 @@
 """__init__ module for the player package"""
 
 from cribbage.player.define_player import Player, Computer
+from cribbage.player.crib_table import CribTable
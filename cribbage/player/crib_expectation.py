@@ -0,0 +1,102 @@
+"""Module for calculating the exact expected score of a crib"""
+
+from cribbage.card import cards_list, suits_list
+from cribbage.deck.score_table import get_rank_score_table, order_primes, rank_key
+
+
+def expected_crib_score(discarded_cards, unseen_cards):
+    """Function for calculating the average crib score over every opponent discard and shared card"""
+
+    total_score, total_possibilities = total_crib_score(discarded_cards=discarded_cards, unseen_cards=unseen_cards)
+
+    return total_score / total_possibilities
+
+
+def total_crib_score(discarded_cards, unseen_cards):
+    """Function for summing the crib score over every opponent discard and shared card"""
+
+    # Rather than scoring every possible crib, cards are grouped by rank and suit
+    # Each group is scored once and weighted by the number of cards in it
+    first_discard, second_discard = discarded_cards
+
+    unseen_count = len(unseen_cards)
+
+    # Total number of (opponent discard, shared card) possibilities
+    total_possibilities = unseen_count * (unseen_count - 1) // 2 * (unseen_count - 2)
+
+    # Count the unseen cards of each order and each suit
+    order_counts = [0] * (len(cards_list) + 1)
+    suit_counts = dict.fromkeys(suits_list, 0)
+    unseen_jack_suits = set()
+
+    for i in unseen_cards:
+
+        order_counts[i.order] += 1
+        suit_counts[i.suit] += 1
+
+        if i.rank == "J":
+
+            unseen_jack_suits.add(i.suit)
+
+    orders = [i for i in range(1, len(order_counts)) if order_counts[i] > 0]
+
+    table = get_rank_score_table()
+    discard_key = rank_key(discarded_cards)
+
+    total_score = 0
+
+    # Fifteens, pairs and runs, grouped by the orders of the opponent's two cards and the shared card
+    for first_index, first_order in enumerate(orders):
+
+        for second_order in orders[first_index:]:
+
+            # Number of ways the opponent can discard cards of these two orders
+            if first_order == second_order:
+
+                discard_ways = order_counts[first_order] * (order_counts[first_order] - 1) // 2
+
+            else:
+
+                discard_ways = order_counts[first_order] * order_counts[second_order]
+
+            if discard_ways == 0:
+
+                continue
+
+            pair_key = discard_key * order_primes[first_order] * order_primes[second_order]
+
+            for shared_order in orders:
+
+                # The shared card can't be one of the opponent's discards
+                shared_ways = order_counts[shared_order] - (shared_order == first_order) - (shared_order == second_order)
+
+                if shared_ways > 0:
+
+                    total_score += discard_ways * shared_ways * table[pair_key * order_primes[shared_order]]
+
+    # A crib only scores a flush if all five cards share the suit of the discarded cards
+    if first_discard.suit == second_discard.suit:
+
+        suit_count = suit_counts[first_discard.suit]
+
+        total_score += 5 * suit_count * (suit_count - 1) // 2 * (suit_count - 2)
+
+    discarded_jack_suits = {i.suit for i in discarded_cards if i.rank == "J"}
+
+    # Nobs, grouped by the suit of the shared card
+    for suit in suits_list:
+
+        # The shared card must not be a Jack
+        shared_ways = suit_counts[suit] - (suit in unseen_jack_suits)
+
+        # If the Jack was discarded, any opponent discard will do
+        if suit in discarded_jack_suits:
+
+            total_score += shared_ways * (unseen_count - 1) * (unseen_count - 2) // 2
+
+        # Otherwise the opponent must discard the Jack along with any other card
+        elif suit in unseen_jack_suits:
+
+            total_score += shared_ways * (unseen_count - 2)
+
+    return total_score, total_possibilities
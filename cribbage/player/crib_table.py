@@ -0,0 +1,85 @@
+"""Module for reading a precomputed table of expected crib scores for every two card discard"""
+
+import os
+import json
+
+
+# The table shipped with the package
+default_table_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "crib_table.json")
+
+table_version = 1
+
+# A held card's suit either matches neither discard, the lower discard or the higher discard
+no_suit_match = 0
+lower_suit_match = 1
+higher_suit_match = 2
+
+
+def discard_key(discarded_cards):
+    """Function for finding the lower order, higher order and suitedness of a two card discard"""
+
+    first_card, second_card = sorted(discarded_cards, key=lambda x: x.order)
+
+    return first_card.order, second_card.order, first_card.suit == second_card.suit
+
+
+def suit_match(card, discarded_cards):
+    """Function for finding how a held card's suit matches the suits of a two card discard"""
+
+    first_card, second_card = sorted(discarded_cards, key=lambda x: x.order)
+
+    # Discards of the same order are interchangeable, so matching either counts as matching the lower one
+    if card.suit == first_card.suit:
+
+        return lower_suit_match
+
+    if card.suit == second_card.suit:
+
+        return lower_suit_match if first_card.order == second_card.order else higher_suit_match
+
+    return no_suit_match
+
+
+class CribTable:
+    """Class for looking up the approximate expected crib score of a discard"""
+
+    def __init__(self, path=default_table_path, table=None):
+
+        self.error = None
+
+        # Use a table already in memory, otherwise read it from the file
+        if table is None:
+
+            with open(path) as table_file:
+
+                table_data = json.load(table_file)
+
+            if table_data.get("version") != table_version:
+
+                raise ValueError("Unsupported crib table version")
+
+            self.error = table_data["error"]
+
+            table = {
+                (i["lower_order"], i["higher_order"], i["suited"]): (i["base"], i["corrections"])
+                for i in table_data["entries"]
+            }
+
+        self.table = table
+
+    def expected_score(self, discarded_cards, held_cards=None):
+        """Method for finding the expected crib score of a discard, corrected for any cards the thrower holds"""
+
+        base_score, corrections = self.table[discard_key(discarded_cards)]
+
+        score = base_score
+
+        # Each held card can't be in the crib or the shared card, which changes the expected score
+        if held_cards is not None:
+
+            for i in held_cards:
+
+                score += corrections[i.order - 1][suit_match(i, discarded_cards)]
+
+        return score
+
@@ -0,0 +1,164 @@
+"""Module for building the table of expected crib scores for every two card discard and measuring its error"""
+
+import json
+import random
+import argparse
+from cribbage.card import Card, cards_list, suits_list
+from cribbage.files import write_atomically
+from cribbage.deck.functions import unique_combinations
+from cribbage.player.crib_expectation import expected_crib_score
+from cribbage.player.crib_table import CribTable, default_table_path, table_version, no_suit_match, \
+    lower_suit_match, higher_suit_match, suit_match
+
+
+def representative_discard(lower_order, higher_order, suited):
+    """Function for building one discard of the given orders and suitedness"""
+
+    lower_card = Card(rank=cards_list[lower_order - 1], suit=suits_list[0])
+    higher_card = Card(rank=cards_list[higher_order - 1], suit=suits_list[0] if suited else suits_list[1])
+
+    return [lower_card, higher_card]
+
+
+def representative_held_card(order, match, discarded_cards):
+    """Function for building a card of the given order whose suit matches the discard as given, or None if impossible"""
+
+    for suit in suits_list:
+
+        card = Card(rank=cards_list[order - 1], suit=suit)
+
+        if card not in discarded_cards and suit_match(card, discarded_cards) == match:
+
+            return card
+
+    return None
+
+
+def build_crib_table():
+    """Function for calculating the expected crib score of every discard, and how it changes with each held card"""
+
+    full_deck = [Card(rank=j, suit=i) for i in suits_list for j in cards_list]
+
+    table = {}
+
+    for lower_order in range(1, len(cards_list) + 1):
+
+        for higher_order in range(lower_order, len(cards_list) + 1):
+
+            # A pair can't be suited
+            for suited in ([False] if lower_order == higher_order else [False, True]):
+
+                discarded_cards = representative_discard(lower_order, higher_order, suited)
+
+                unseen_cards = [i for i in full_deck if i not in discarded_cards]
+
+                base_score = expected_crib_score(discarded_cards=discarded_cards, unseen_cards=unseen_cards)
+
+                # The change in the expected score when the thrower is known to hold one more card
+                corrections = []
+
+                for order in range(1, len(cards_list) + 1):
+
+                    order_corrections = []
+
+                    for match in [no_suit_match, lower_suit_match, higher_suit_match]:
+
+                        held_card = representative_held_card(order, match, discarded_cards)
+
+                        if held_card is None:
+
+                            order_corrections.append(None)
+
+                            continue
+
+                        held_score = expected_crib_score(
+                            discarded_cards=discarded_cards,
+                            unseen_cards=[i for i in unseen_cards if i is not held_card]
+                        )
+
+                        order_corrections.append(held_score - base_score)
+
+                    corrections.append(order_corrections)
+
+                table[(lower_order, higher_order, suited)] = (base_score, corrections)
+
+    return table
+
+
+def measure_crib_table_error(crib_table, samples=2000, seed=0):
+    """Function for comparing the table's approximation with the exact expected crib score of random deals"""
+
+    rng = random.Random(seed)
+
+    full_deck = [Card(rank=j, suit=i) for i in suits_list for j in cards_list]
+
+    errors = []
+
+    for _ in range(samples):
+
+        hand_cards = rng.sample(full_deck, 6)
+
+        unseen_cards = [i for i in full_deck if i not in hand_cards]
+
+        for held_cards in unique_combinations(hand_cards, 4, 4):
+
+            discarded_cards = [i for i in hand_cards if i not in held_cards]
+
+            exact_score = expected_crib_score(discarded_cards=discarded_cards, unseen_cards=unseen_cards)
+
+            table_score = crib_table.expected_score(discarded_cards=discarded_cards, held_cards=held_cards)
+
+            errors.append(abs(table_score - exact_score))
+
+    return {
+        "samples": len(errors),
+        "mean_absolute_error": sum(errors) / len(errors),
+        "maximum_absolute_error": max(errors)
+    }
+
+
+def write_crib_table(path, table, error=None):
+    """Function for writing a crib table to a JSON file"""
+
+    entries = [
+        {
+            "lower_order": lower_order,
+            "higher_order": higher_order,
+            "suited": suited,
+            "base": base_score,
+            "corrections": corrections
+        }
+        for (lower_order, higher_order, suited), (base_score, corrections) in sorted(table.items())
+    ]
+
+    with write_atomically(path) as table_file:
+
+        json.dump({"version": table_version, "error": error, "entries": entries}, table_file)
+
+    return
+
+
+def generate_crib_table(path, samples=2000, seed=0):
+    """Function for building a crib table, measuring its error and writing it to a file"""
+
+    crib_table = CribTable(table=build_crib_table())
+
+    crib_table.error = measure_crib_table_error(crib_table=crib_table, samples=samples, seed=seed)
+
+    write_crib_table(path=path, table=crib_table.table, error=crib_table.error)
+
+    return crib_table
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Build the crib table for every two card discard")
+    parser.add_argument("path", nargs="?", default=default_table_path, help="File to write the table to")
+    parser.add_argument("--samples", type=int, default=2000, help="Number of random deals used to measure the error")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for choosing the random deals")
+
+    arguments = parser.parse_args()
+
+    generated_table = generate_crib_table(path=arguments.path, samples=arguments.samples, seed=arguments.seed)
+
+    print(json.dumps(generated_table.error, indent=1))
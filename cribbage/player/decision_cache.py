@@ -0,0 +1,83 @@
+"""Module for defining a size-bounded cache of Computer decisions"""
+
+from collections import OrderedDict
+from cribbage.instrumentation import instrumentation
+
+
+class DecisionCache:
+    """Class for a least recently used cache of scores with hit, miss and eviction counts"""
+
+    def __init__(self, maximum_size):
+
+        if maximum_size < 1:
+
+            raise ValueError("Cache size must be at least 1")
+
+        self.maximum_size = maximum_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Method for retrieving an entry from the cache, returning None if it isn't there"""
+
+        try:
+
+            value = self.entries[key]
+
+        except KeyError:
+
+            self.misses += 1
+
+            if instrumentation.enabled:
+
+                instrumentation.record_cache_lookup(hit=False)
+
+            return None
+
+        # Mark the entry as the most recently used
+        self.entries.move_to_end(key)
+
+        self.hits += 1
+
+        if instrumentation.enabled:
+
+            instrumentation.record_cache_lookup(hit=True)
+
+        return value
+
+    def put(self, key, value):
+        """Method for adding an entry to the cache, evicting the least recently used entry if full"""
+
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+
+        if len(self.entries) > self.maximum_size:
+
+            self.entries.popitem(last=False)
+
+            self.evictions += 1
+
+        return
+
+    def clear(self):
+        """Method for emptying the cache and resetting its statistics"""
+
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        return
+
+    def statistics(self):
+        """Method for reporting the cache's size and hit, miss and eviction counts"""
+
+        return {
+            "size": len(self.entries),
+            "maximum_size": self.maximum_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
@@ -1,9 +1,18 @@
 """Module for defining a player"""
 
-from numpy import mean
+from copy import copy
 from random import choice
-from cribbage.deck import Hand, unique_combinations
+from itertools import repeat
+from cribbage.card import card_to_id
+from cribbage.deck import Hand, unique_combinations, cards_to_mask
 from cribbage.player.functions import prompt_player_for_input
+from cribbage.player.crib_expectation import expected_crib_score
+from cribbage.player.decision_cache import DecisionCache
+from cribbage.player.parallel_scoring import score_combination_ids
+from cribbage.player.monte_carlo import estimate_combination_scores
+from cribbage.player.pegging_search import PeggingSearch
+from cribbage.canonical import canonical_key, canonical_combination_indices
+from cribbage.instrumentation import instrumented
 
 
 class Player:
@@ -42,6 +51,13 @@ class Player:
 
         return
 
+    def remove_crib(self):
+        """Method for taking the crib away from a player"""
+
+        self.has_crib = False
+
+        return
+
     def discard(self):
         """Method for prompting a player to discard"""
 
@@ -99,15 +115,62 @@ class Player:
 
         return discarded_cards
 
+    def choose_play(self, playable_cards, pegging_state, cards_left=None, unseen_cards=None, opponent_card_count=None,
+                    opponent_stuck=False):
+        """Method for prompting a player to choose a card to play during pegging"""
+
+        print(f"Count: {pegging_state.count}\t" + "\t".join(i.unicode for i in pegging_state.cards))
+
+        unicode_list = [i.unicode for i in playable_cards]
+
+        print("\t".join(unicode_list))
+        print("\t".join(str(i) for i in range(1, len(unicode_list) + 1)))
+
+        card_chosen = prompt_player_for_input(
+            prompt="Choose a card to play: ",
+            valid_choices=[str(i) for i in range(1, len(playable_cards) + 1)],
+            invalid_selection_message=f"Please choose a card number between 1 and {len(playable_cards)}"
+        )
+
+        return playable_cards[int(card_chosen) - 1]
+
 
 class Computer(Player):
     """Class for an Computer player"""
 
-    def __init__(self, difficulty="standard"):
+    def __init__(self, difficulty="standard", cache_size=None, workers=None, mode="exact", time_budget=0.05,
+                 target_error=0.05, play_time_limit="difficulty"):
 
         super().__init__("Computer")
         self.difficulty = difficulty
         self.all_cards = None
+        self.discard_table = None
+        self.crib_table = None
+
+        # Optionally cache the scores of hands already seen
+        self.decision_cache = None if cache_size is None else DecisionCache(maximum_size=cache_size)
+
+        # Optionally score combinations in a pool of worker processes, started on first use
+        self.workers = workers
+        self.executor = None
+
+        # Scores are either calculated exactly or estimated by sampling within a time budget
+        if mode not in ["exact", "sampling"]:
+
+            raise ValueError("Invalid mode choice")
+
+        self.mode = mode
+        self.time_budget = time_budget
+        self.target_error = target_error
+
+        # Pegging plays are searched within a time limit per play, set by the difficulty unless given
+        # A limit of None searches to the full depth however long it takes
+        self.play_time_limit = play_time_limit
+        self.pegging_search = None
+
+        # A discard can be scored in a background thread while the other player decides theirs
+        self.speculative_discard = None
+        self.speculative_inputs = None
 
     def add_cards_list(self, all_cards):
         """Method for assigning a full list of cards to the Computer player for use in decisions"""
@@ -116,7 +179,45 @@ class Computer(Player):
 
         return
 
+    def add_discard_table(self, discard_table):
+        """Method for assigning a precomputed discard table to the Computer player for use in decisions"""
+
+        self.discard_table = discard_table
+
+        return
+
+    def add_crib_table(self, crib_table):
+        """Method for assigning a precomputed crib table to the Computer player to approximate crib scores"""
+
+        self.crib_table = crib_table
+
+        return
+
+    def close(self):
+        """Method for shutting down the Computer's worker processes and abandoning any discard started early"""
+
+        self.cancel_discard()
+
+        # Don't wait for work sent by an abandoned discard, which would only be thrown away
+        if self.executor is not None:
+
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+            self.executor = None
+
+        return
+
+    def cache_statistics(self):
+        """Method for reporting the decision cache's statistics, or None if there is no cache"""
+
+        if self.decision_cache is None:
+
+            return None
+
+        return self.decision_cache.statistics()
+
     @staticmethod
+    @instrumented("calculate_combination_hand_scores")
     def calculate_combination_hand_scores(card_combinations, full_deck):
         """Method for calculating the average score of each hand combination"""
 
@@ -125,8 +226,6 @@ class Computer(Player):
         # Loop through each combination
         for i in card_combinations:
 
-            possible_scores_list = []
-
             # Create a hand object
             possible_hand = Hand(is_crib=False)
 
@@ -135,83 +234,175 @@ class Computer(Player):
 
                 possible_hand.add_card(card)
 
-            # Loop through each card left in the deck
-            for shared_card in full_deck:
-
-                # Calculate the score
-                possible_score = possible_hand.score_hand(shared_card=shared_card)
-
-                # Add the score to the score list
-                possible_scores_list.append(possible_score)
-
-                # Remove the shared card from the hand
-                possible_hand.remove_card(card=shared_card)
+            # Calculate the score with each card left in the deck as the shared card
+            possible_scores_list = possible_hand.score_all_starters(candidates=full_deck)
 
             # Calculate the mean score
-            average_score = mean(possible_scores_list)
+            average_score = sum(possible_scores_list) / len(possible_scores_list)
 
             # Add to the list
             possible_average_scores.append(average_score)
 
         return possible_average_scores
 
+    @instrumented("calculate_combination_crib_scores")
     def calculate_combination_crib_scores(self, card_combinations, full_deck):
         """Method for calculating the average score of each crib combination"""
 
-        # TODO: Speed up this function
-
         possible_average_scores = []
 
-        # Find unique combinations of the remaining cards of length 2
-        other_card_possibilities = unique_combinations(full_deck, 2, 2)
-
         # Loop through all hand combinations
         for i in card_combinations:
 
-            possible_score_list = []
+            # Get the two discard cards
+            kept_mask = cards_to_mask(i)
 
-            # Create a crib
-            possible_hand = Hand(is_crib=True)
+            discarded_cards = [k for k in self.hand.cards if not kept_mask & k.bit]
 
-            # Get the two discard cards and add them to the crib
-            for card in [k for k in self.hand.cards if k not in i]:
+            # A crib table assumes only the six cards dealt to the Computer have been seen
+            if self.crib_table is not None and len(full_deck) == len(self.all_cards) - len(self.hand.cards):
 
-                possible_hand.add_card(card)
+                average_score = self.crib_table.expected_score(discarded_cards=discarded_cards, held_cards=i)
 
-            # Loop through the combination of other cards
-            for j in other_card_possibilities:
+            # Otherwise calculate the average score of the crib over all other cards
+            else:
 
-                # Add the first two to the crib
-                for card in j:
+                average_score = expected_crib_score(discarded_cards=discarded_cards, unseen_cards=full_deck)
 
-                    possible_hand.add_card(card)
+            # Append to the list
+            possible_average_scores.append(average_score)
 
-                for shared_card in [card for card in full_deck if card not in j]:
+        return possible_average_scores
 
-                    # Calculate the score with the third card as the shared card
-                    possible_score = possible_hand.score_hand(shared_card=shared_card)
+    def calculate_combination_scores(self, card_combinations, full_deck):
+        """Method for calculating the average hand and crib scores of each combination"""
 
-                    # Add to the list of scores
-                    possible_score_list.append(possible_score)
+        # A discard table can only be used when every other card in the deck is unseen
+        if self.discard_table is not None and len(full_deck) == self.discard_table.hand_possibilities:
 
-                    # Remove the shared card from the hand
-                    possible_hand.remove_card(shared_card)
+            table_scores = self.discard_table.lookup(hand_cards=self.hand.cards)
 
-                # Remove all the cards from the hand
-                for card in j:
+            if table_scores is not None:
 
-                    possible_hand.remove_card(card)
+                return table_scores
 
-            # Calculate the average score fro the combination
-            average_score = mean(possible_score_list)
+        # With a crib table the remaining work is too little to be worth sending to workers
+        if self.workers is not None and self.crib_table is None:
 
-            # Append to the list
-            possible_average_scores.append(average_score)
+            return self.calculate_combination_scores_parallel(
+                card_combinations=card_combinations,
+                full_deck=full_deck
+            )
 
-        return possible_average_scores
+        # Calculate the average score for each hand combination
+        possible_average_hand_scores = self.calculate_combination_hand_scores(
+            card_combinations=card_combinations,
+            full_deck=full_deck
+        )
 
-    def choose_combination(self, card_combinations, average_scores):
-        """Method for choosing which cards to discard from a Computer's hand"""
+        # Calculate the average crib score for each hand combination
+        possible_average_crib_scores = self.calculate_combination_crib_scores(
+            card_combinations=card_combinations,
+            full_deck=full_deck
+        )
+
+        return possible_average_hand_scores, possible_average_crib_scores
+
+    def start_executor(self):
+        """Method for starting the pool of worker processes, if it hasn't been started already"""
+
+        if self.executor is None:
+
+            # Imported here so the package starts quickly when no workers are used
+            from concurrent.futures import ProcessPoolExecutor
+
+            self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        return
+
+    def calculate_combination_scores_parallel(self, card_combinations, full_deck):
+        """Method for calculating the average hand and crib scores of each combination across worker processes"""
+
+        self.start_executor()
+
+        # Send cards to the workers as ids
+        kept_ids_list = [[card_to_id(card) for card in i] for i in card_combinations]
+
+        # Each combination's mask is found once rather than once per card in the hand
+        kept_masks = [cards_to_mask(i) for i in card_combinations]
+        discarded_ids_list = [
+            [card_to_id(card) for card in self.hand.cards if not kept_mask & card.bit] for kept_mask in kept_masks
+        ]
+        unseen_ids = [card_to_id(i) for i in full_deck]
+
+        results = list(self.executor.map(
+            score_combination_ids,
+            kept_ids_list,
+            discarded_ids_list,
+            repeat(unseen_ids, len(card_combinations))
+        ))
+
+        possible_average_hand_scores = [i[0] for i in results]
+        possible_average_crib_scores = [i[1] for i in results]
+
+        return possible_average_hand_scores, possible_average_crib_scores
+
+    def calculate_total_average_scores(self, card_combinations, full_deck):
+        """Method for calculating the average hand score of each combination, including or excluding the crib"""
+
+        cache_key = None
+
+        # Equivalent hands have the same scores, so look them up by their canonical form
+        if self.decision_cache is not None:
+
+            hand_key, permutation = canonical_key(hand=self.hand.cards, known_cards=full_deck)
+
+            cache_key = (hand_key, self.has_crib)
+
+            original_indices = canonical_combination_indices(cards=self.hand.cards, permutation=permutation, length=4)
+
+            cached_scores = self.decision_cache.get(cache_key)
+
+            # Cached scores are stored in canonical order
+            if cached_scores is not None:
+
+                total_average_scores = [0.0] * len(original_indices)
+
+                for i, original_index in enumerate(original_indices):
+
+                    total_average_scores[original_index] = cached_scores[i]
+
+                return total_average_scores
+
+        # Calculate the average hand and crib scores for each combination
+        possible_average_hand_scores, possible_average_crib_scores = self.calculate_combination_scores(
+            card_combinations=card_combinations,
+            full_deck=full_deck
+        )
+
+        # If the computer has the crib, add crib points to hand points
+        if self.has_crib:
+
+            total_average_scores = [a + b for a, b in zip(possible_average_hand_scores, possible_average_crib_scores)]
+
+        # If player has the crib, subtract crib points from hand points
+        elif not self.has_crib:
+
+            total_average_scores = [a - b for a, b in zip(possible_average_hand_scores, possible_average_crib_scores)]
+
+        # Otherwise raise an error because something is broken
+        else:
+
+            raise ValueError("Attribute 'has_crib' not initialised")
+
+        if cache_key is not None:
+
+            self.decision_cache.put(cache_key, [total_average_scores[i] for i in original_indices])
+
+        return total_average_scores
+
+    def get_choice_range(self):
+        """Method for finding how many of the best combinations the Computer chooses between"""
 
         # Set the range of the random choice based on the computer's difficulty level
         # There will always be 15 combinations
@@ -235,6 +426,27 @@ class Computer(Player):
 
             raise ValueError("Invalid difficulty choice")
 
+        return choice_range
+
+    def estimate_total_average_scores(self, card_combinations, full_deck):
+        """Method for estimating the average total score of each combination by sampling, with standard errors"""
+
+        return estimate_combination_scores(
+            hand_cards=self.hand.cards,
+            card_combinations=card_combinations,
+            unseen_cards=full_deck,
+            has_crib=self.has_crib,
+            time_budget=self.time_budget,
+            target_error=self.target_error,
+            separation_count=self.get_choice_range()
+        )
+
+    @instrumented("choose_combination")
+    def choose_combination(self, card_combinations, average_scores):
+        """Method for choosing which cards to discard from a Computer's hand"""
+
+        choice_range = self.get_choice_range()
+
         # Zip the combinations and scores together
         zipped_list = zip(card_combinations, average_scores)
 
@@ -249,11 +461,13 @@ class Computer(Player):
 
         return combination_choice
 
-    def discard(self):
-        """Method to choose cards to discard"""
+    def calculate_discard_scores(self):
+        """Method for finding every combination of cards the Computer could keep, with its average total score"""
 
         # Get all cards excluding those in the computer's hand
-        full_deck = [i for i in self.all_cards if i not in self.hand.cards]
+        hand_mask = self.hand.mask
+
+        full_deck = [i for i in self.all_cards if not hand_mask & i.bit]
 
         # Get all combinations of cards of length 4
         card_combinations = unique_combinations(self.hand.cards, 4, 4)
@@ -263,34 +477,128 @@ class Computer(Player):
 
             raise ValueError("Maths is broken: 6 choose 4 has 15 combinations")
 
-        # Calculate the average score for each hand combination
-        possible_average_hand_scores = self.calculate_combination_hand_scores(
-            card_combinations=card_combinations,
-            full_deck=full_deck
-        )
+        # Estimate the average total score for each combination by sampling
+        if self.mode == "sampling":
 
-        # Calculate the average crib score for each hand combination
-        possible_average_crib_scores = self.calculate_combination_crib_scores(
-            card_combinations=card_combinations,
-            full_deck=full_deck
+            total_average_scores, _ = self.estimate_total_average_scores(
+                card_combinations=card_combinations,
+                full_deck=full_deck
+            )
+
+        # Otherwise calculate the average total score for each combination exactly
+        else:
+
+            total_average_scores = self.calculate_total_average_scores(
+                card_combinations=card_combinations,
+                full_deck=full_deck
+            )
+
+        return card_combinations, total_average_scores
+
+    def discard_inputs(self):
+        """Method for describing everything the scores of a discard depend on"""
+
+        return (
+            self.hand.mask, self.has_crib, tuple(self.all_cards), self.discard_table, self.crib_table, self.mode,
+            self.difficulty, self.time_budget, self.target_error
         )
 
-        # If the computer has the crib, add crib points to hand points
-        if self.has_crib:
+    def calculate_discard_scores_into(self, future):
+        """Method for scoring the discard into a future, for use as the target of a background thread"""
 
-            total_average_scores = [a + b for a, b in zip(possible_average_hand_scores, possible_average_crib_scores)]
+        # The discard may have been abandoned before the thread started
+        if not future.set_running_or_notify_cancel():
 
-        # If player has the crib, subtract crib points from hand points
-        elif not self.has_crib:
+            return
 
-            total_average_scores = [a - b for a, b in zip(possible_average_hand_scores, possible_average_crib_scores)]
+        try:
 
-        # Otherwise raise an error because something is broken
+            future.set_result(self.calculate_discard_scores())
+
+        except BaseException as error:
+
+            future.set_exception(error)
+
+        return
+
+    def start_discard(self):
+        """Method for starting to score the Computer's discard in a background thread, as soon as its cards are dealt"""
+
+        self.cancel_discard()
+
+        # Sampling draws from the random module shared with the rest of the game, so it is only done when discarding
+        # This keeps seeded games reproducible, and sampling is bounded by a short time budget anyway
+        if self.mode == "sampling":
+
+            return
+
+        # Imported here so the package starts quickly when discards aren't started early
+        from threading import Thread
+        from concurrent.futures import Future
+
+        # Score a copy, so changes to the Computer while the discard is scored can't affect it
+        speculative_computer = copy(self)
+        speculative_computer.hand = Hand(is_crib=self.hand.is_crib)
+
+        for i in self.hand.cards:
+
+            speculative_computer.hand.add_card(i)
+
+        # The copy has no decision cache, so the cache is never used by two threads at once
+        speculative_computer.decision_cache = None
+
+        # Start any worker processes here, so the copy shares the pool that is shut down on closing
+        if self.workers is not None and self.crib_table is None:
+
+            self.start_executor()
+
+            speculative_computer.executor = self.executor
+
+        # Remember what the discard was scored with, so the scores are only used if nothing has changed
+        self.speculative_inputs = self.discard_inputs()
+        self.speculative_discard = Future()
+
+        # A daemon thread never holds up closing the Computer or exiting, and an abandoned result is thrown away
+        Thread(target=speculative_computer.calculate_discard_scores_into, args=(self.speculative_discard,),
+               daemon=True).start()
+
+        return
+
+    def cancel_discard(self):
+        """Method for abandoning a discard started in the background, if any, without waiting for it"""
+
+        if self.speculative_discard is not None:
+
+            # A discard already being scored can't be stopped, but its scores are never used
+            self.speculative_discard.cancel()
+
+            self.speculative_discard = None
+            self.speculative_inputs = None
+
+        return
+
+    @instrumented("discard", decision=True)
+    def discard(self):
+        """Method to choose cards to discard"""
+
+        # Use the scores of a discard started in the background, waiting for them if needed
+        # The scores are only used if the hand, crib, cards and tables are the same as when it was started
+        if self.speculative_discard is not None and self.speculative_inputs == self.discard_inputs():
+
+            card_combinations, total_average_scores = self.speculative_discard.result()
+
+            self.speculative_discard = None
+            self.speculative_inputs = None
+
+        # Otherwise score the combinations now
         else:
 
-            raise ValueError("Attribute 'has_crib' not initialised")
+            self.cancel_discard()
+
+            card_combinations, total_average_scores = self.calculate_discard_scores()
 
         # Make a choice of combination to keep
+        # The choice is random, so it's always made here rather than in the background to keep results reproducible
         combination_choice = self.choose_combination(
             card_combinations=card_combinations,
             average_scores=total_average_scores
@@ -298,11 +606,13 @@ class Computer(Player):
 
         discarded_cards = []
 
+        choice_mask = cards_to_mask(combination_choice)
+
         # Loop through cards in the computer's hand
         for i in list(self.hand.cards):  # Using a copy of the card list here as we are altering the list as we go
 
             # Check whether the card appears in the chosen combination
-            if i not in combination_choice:
+            if not choice_mask & i.bit:
 
                 # If not, add to the discard list
                 discarded_cards.append(i)
@@ -311,3 +621,82 @@ class Computer(Player):
                 self.hand.remove_card(i)
 
         return discarded_cards
+
+    def get_search_depth(self):
+        """Method for finding how many cards ahead the Computer searches during pegging"""
+
+        # Set the depth of the search based on the computer's difficulty level
+        # There are at most eight cards to play
+        if self.difficulty == "easy":
+
+            search_depth = 1
+
+        elif self.difficulty == "standard":
+
+            search_depth = 2
+
+        elif self.difficulty == "hard":
+
+            search_depth = 4
+
+        elif self.difficulty == "perfect":
+
+            search_depth = 8
+
+        else:
+
+            raise ValueError("Invalid difficulty choice")
+
+        return search_depth
+
+    def get_play_time_limit(self):
+        """Method for finding how long the Computer searches for each pegging play, in seconds"""
+
+        # A time limit given when creating the Computer overrides the difficulty
+        if self.play_time_limit != "difficulty":
+
+            return self.play_time_limit
+
+        # Set the time limit based on the computer's difficulty level
+        if self.difficulty == "easy":
+
+            time_limit = 0.02
+
+        elif self.difficulty == "standard":
+
+            time_limit = 0.05
+
+        elif self.difficulty == "hard":
+
+            time_limit = 0.1
+
+        elif self.difficulty == "perfect":
+
+            time_limit = 0.25
+
+        else:
+
+            raise ValueError("Invalid difficulty choice")
+
+        return time_limit
+
+    @instrumented("choose_play", decision=True)
+    def choose_play(self, playable_cards, pegging_state, cards_left, unseen_cards, opponent_card_count,
+                    opponent_stuck=False):
+        """Method for choosing a card to play during pegging"""
+
+        # The search is created on first use as it depends on the difficulty
+        if self.pegging_search is None:
+
+            self.pegging_search = PeggingSearch(
+                maximum_depth=self.get_search_depth(), time_limit=self.get_play_time_limit()
+            )
+
+        return self.pegging_search.choose(
+            playable_cards=playable_cards,
+            pegging_state=pegging_state,
+            cards_left=cards_left,
+            unseen_cards=unseen_cards,
+            opponent_card_count=opponent_card_count,
+            opponent_stuck=opponent_stuck
+        )
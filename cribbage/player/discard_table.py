@@ -0,0 +1,241 @@
+"""Module for building and reading a precomputed table of discard scores for every six card hand"""
+
+import mmap
+import struct
+import argparse
+from array import array
+from bisect import bisect_left
+from itertools import combinations
+from multiprocessing import Pool
+from cribbage.card import Card, cards_list, suits_list
+from cribbage.files import write_atomically
+from cribbage.canonical import canonical_hands, canonical_hand_key, canonical_combination_indices, pack_masks, \
+    unpack_masks
+from cribbage.deck.functions import unique_combinations
+from cribbage.deck.score_table import score_all_shared_cards
+from cribbage.player.crib_expectation import total_crib_score
+
+
+# File layout: header, then the sorted canonical hand keys, then crib score totals, then hand score totals
+# Totals are stored rather than averages so the table reproduces the exact averages
+header_format = "<8sQII"
+header_size = struct.calcsize(header_format)
+magic = b"CRIBDSC1"
+
+# Every six card hand has 15 combinations of four cards to keep
+keep_count = len(list(combinations(range(6), 4)))
+
+# A hand is compared against the other 46 cards in the deck
+unseen_count = len(cards_list) * len(suits_list) - 6
+hand_possibilities = unseen_count
+crib_possibilities = unseen_count * (unseen_count - 1) // 2 * (unseen_count - 2)
+
+
+def score_canonical_hand(masks):
+    """Function for summing the hand and crib scores of each combination of a canonical six card hand"""
+
+    # Build the hand from a full deck so the remaining cards can be found
+    full_deck = [Card(rank=j, suit=i) for i in suits_list for j in cards_list]
+
+    hand_cards = [
+        card for card in full_deck if masks[suits_list.index(card.suit)] & (1 << (card.order - 1))
+    ]
+
+    unseen_cards = [i for i in full_deck if i not in hand_cards]
+
+    hand_totals = []
+    crib_totals = []
+
+    for i in unique_combinations(hand_cards, 4, 4):
+
+        hand_totals.append(sum(score_all_shared_cards(hand_cards=i, shared_cards=unseen_cards, is_crib=False)))
+
+        discarded_cards = [k for k in hand_cards if k not in i]
+
+        crib_totals.append(total_crib_score(discarded_cards=discarded_cards, unseen_cards=unseen_cards)[0])
+
+    return pack_masks(masks), hand_totals, crib_totals
+
+
+def score_canonical_hands(task):
+    """Function for scoring a chunk of canonical hands given by their keys, for use in a worker process"""
+
+    start, keys = task
+
+    hand_totals = array("H")
+    crib_totals = array("I")
+
+    for key in keys:
+
+        _, key_hand_totals, key_crib_totals = score_canonical_hand(unpack_masks(key))
+
+        hand_totals.extend(key_hand_totals)
+        crib_totals.extend(key_crib_totals)
+
+    # Typed arrays are much smaller than lists of integers to send back from the worker
+    return start, hand_totals, crib_totals
+
+
+def write_discard_table(path, scored_hands):
+    """Function for writing scored hands to a discard table file"""
+
+    # Hands are looked up by binary search, so sort by key
+    scored_hands = sorted(scored_hands, key=lambda x: x[0])
+
+    keys = array("Q", [i[0] for i in scored_hands])
+    crib_totals = array("I", [j for i in scored_hands for j in i[2]])
+    hand_totals = array("H", [j for i in scored_hands for j in i[1]])
+
+    write_discard_arrays(path=path, keys=keys, hand_totals=hand_totals, crib_totals=crib_totals)
+
+    return
+
+
+def write_discard_arrays(path, keys, hand_totals, crib_totals):
+    """Function for writing sorted hand keys and the matching score totals to a discard table file"""
+
+    with write_atomically(path, "wb") as table_file:
+
+        table_file.write(struct.pack(header_format, magic, len(keys), hand_possibilities, crib_possibilities))
+
+        keys.tofile(table_file)
+        crib_totals.tofile(table_file)
+        hand_totals.tofile(table_file)
+
+    return
+
+
+def score_discard_keys(keys, workers=None, chunk_size=1000):
+    """Function for scoring sorted canonical hand keys across worker processes, returning the score totals in order"""
+
+    # The totals are filled in place, so only the compact arrays are ever held rather than a list of every result
+    hand_totals = array("H", bytes(len(keys) * keep_count * array("H").itemsize))
+    crib_totals = array("I", bytes(len(keys) * keep_count * array("I").itemsize))
+
+    tasks = ((i, keys[i:i + chunk_size]) for i in range(0, len(keys), chunk_size))
+
+    with Pool(processes=workers) as pool:
+
+        for start, chunk_hand_totals, chunk_crib_totals in pool.imap_unordered(score_canonical_hands, tasks):
+
+            position = start * keep_count
+
+            hand_totals[position:position + len(chunk_hand_totals)] = chunk_hand_totals
+            crib_totals[position:position + len(chunk_crib_totals)] = chunk_crib_totals
+
+    return hand_totals, crib_totals
+
+
+def build_discard_table(path, workers=None, chunk_size=1000):
+    """Function for scoring every canonical six card hand and writing the discard table"""
+
+    # Hands are looked up by binary search, so their keys are sorted before scoring and each score goes in its place
+    keys = array("Q", sorted(pack_masks(masks) for masks, _ in canonical_hands(6)))
+
+    hand_totals, crib_totals = score_discard_keys(keys=keys, workers=workers, chunk_size=chunk_size)
+
+    write_discard_arrays(path=path, keys=keys, hand_totals=hand_totals, crib_totals=crib_totals)
+
+    return
+
+
+class DiscardTable:
+    """Class for reading a discard table through a shared memory map"""
+
+    def __init__(self, path):
+
+        with open(path, "rb") as table_file:
+
+            # The pages of the map are shared between all processes reading the same file
+            self.map = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        file_magic, hand_count, self.hand_possibilities, self.crib_possibilities = struct.unpack_from(
+            header_format, self.map
+        )
+
+        if file_magic != magic:
+
+            self.close()
+
+            raise ValueError("Not a discard table file")
+
+        self.hand_count = hand_count
+
+        self.view = memoryview(self.map)
+
+        keys_end = header_size + hand_count * 8
+        crib_end = keys_end + hand_count * keep_count * 4
+        hand_end = crib_end + hand_count * keep_count * 2
+
+        if len(self.view) != hand_end:
+
+            self.close()
+
+            raise ValueError("Discard table file is the wrong size")
+
+        self.keys = self.view[header_size:keys_end].cast("Q")
+        self.crib_totals = self.view[keys_end:crib_end].cast("I")
+        self.hand_totals = self.view[crib_end:hand_end].cast("H")
+
+    def close(self):
+        """Method for releasing the views of the table and closing the memory map"""
+
+        # The map can only be closed once nothing is viewing it
+        for i in ["keys", "crib_totals", "hand_totals", "view"]:
+
+            view = getattr(self, i, None)
+
+            if view is not None:
+
+                view.release()
+
+        self.map.close()
+
+        return
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+
+        self.close()
+
+    def lookup(self, hand_cards):
+        """Method for finding the average hand and crib scores of each combination of a six card hand"""
+
+        key, permutation = canonical_hand_key(hand_cards)
+
+        position = bisect_left(self.keys, key)
+
+        # Return None if the hand isn't in the table
+        if position == len(self.keys) or self.keys[position] != key:
+
+            return None
+
+        hand_scores = [0.0] * keep_count
+        crib_scores = [0.0] * keep_count
+
+        start = position * keep_count
+
+        # The table stores combinations of the hand's cards in canonical order
+        original_indices = canonical_combination_indices(cards=hand_cards, permutation=permutation, length=4)
+
+        # Put each score in the position of the matching combination of the hand's own cards
+        for i, original_index in enumerate(original_indices):
+
+            hand_scores[original_index] = self.hand_totals[start + i] / self.hand_possibilities
+            crib_scores[original_index] = self.crib_totals[start + i] / self.crib_possibilities
+
+        return hand_scores, crib_scores
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Build the discard table for every six card hand")
+    parser.add_argument("path", help="File to write the table to")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+
+    arguments = parser.parse_args()
+
+    build_discard_table(path=arguments.path, workers=arguments.workers)
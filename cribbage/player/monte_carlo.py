@@ -0,0 +1,100 @@
+"""Module for estimating the average scores of discard combinations by sampling"""
+
+import random
+from math import sqrt
+from time import perf_counter
+from cribbage.deck.score_table import score_five_cards
+from cribbage.deck.card_mask import cards_to_mask
+
+
+def estimate_combination_scores(hand_cards, card_combinations, unseen_cards, has_crib, time_budget=0.05,
+                                target_error=0.05, separation_count=1, confidence=2.0, batch_size=64,
+                                minimum_samples=128, rng=random):
+    """Function for estimating the average total score of each combination with its standard error"""
+
+    # Crib points count for the computer if it has the crib, and against it otherwise
+    crib_sign = 1 if has_crib else -1
+
+    # Each combination's mask is found once rather than once per card in the hand
+    kept_masks = [cards_to_mask(i) for i in card_combinations]
+    discards_list = [[k for k in hand_cards if not kept_mask & k.bit] for kept_mask in kept_masks]
+
+    combination_count = len(card_combinations)
+
+    score_sums = [0] * combination_count
+    squared_score_sums = [0] * combination_count
+    samples = 0
+
+    deadline = perf_counter() + time_budget
+
+    while True:
+
+        for _ in range(batch_size):
+
+            # Every combination is scored against the same opponent discard and shared card
+            # so that the differences between combinations are estimated more precisely
+            first_card, second_card, shared_card = rng.sample(unseen_cards, 3)
+
+            for i in range(combination_count):
+
+                hand_score = score_five_cards(
+                    hand_cards=card_combinations[i], shared_card=shared_card, is_crib=False
+                )
+
+                crib_score = score_five_cards(
+                    hand_cards=discards_list[i] + [first_card, second_card], shared_card=shared_card, is_crib=True
+                )
+
+                total_score = hand_score + crib_sign * crib_score
+
+                score_sums[i] += total_score
+                squared_score_sums[i] += total_score * total_score
+
+        samples += batch_size
+
+        means = [i / samples for i in score_sums]
+
+        standard_errors = [
+            sqrt(max(squared_score_sums[i] / samples - means[i] ** 2, 0) / (samples - 1))
+            for i in range(combination_count)
+        ]
+
+        if samples < minimum_samples:
+
+            continue
+
+        # Stop once the time is up
+        if perf_counter() >= deadline:
+
+            break
+
+        # Stop once every estimate is precise enough
+        if max(standard_errors) <= target_error:
+
+            break
+
+        # Stop once the candidates that could be chosen are clearly better than the rest
+        if separated(means, standard_errors, separation_count, confidence):
+
+            break
+
+    return means, standard_errors
+
+
+def separated(means, standard_errors, separation_count, confidence):
+    """Function for checking whether the best estimates are statistically separated from the rest"""
+
+    if separation_count >= len(means):
+
+        return True
+
+    ranked = sorted(range(len(means)), key=lambda x: means[x], reverse=True)
+
+    # The worst of the best candidates must be confidently above the best of the rest
+    last_chosen = ranked[separation_count - 1]
+    first_rejected = ranked[separation_count]
+
+    lower_bound = means[last_chosen] - confidence * standard_errors[last_chosen]
+    upper_bound = means[first_rejected] + confidence * standard_errors[first_rejected]
+
+    return lower_bound > upper_bound
@@ -0,0 +1,23 @@
+"""Module for scoring discard combinations in worker processes"""
+
+from cribbage.card import id_to_card
+from cribbage.player.crib_expectation import expected_crib_score
+
+
+def score_combination_ids(kept_ids, discarded_ids, unseen_ids):
+    """Function for calculating the average hand and crib scores of a combination given as card ids"""
+
+    # Imported here as the player module depends on this one
+    from cribbage.player.define_player import Computer
+
+    # Cards are sent to workers as ids, which are much cheaper to pickle than cards
+    kept_cards = tuple(id_to_card(i) for i in kept_ids)
+    discarded_cards = [id_to_card(i) for i in discarded_ids]
+    unseen_cards = [id_to_card(i) for i in unseen_ids]
+
+    # Score exactly as the serial path does
+    hand_score = Computer.calculate_combination_hand_scores(card_combinations=[kept_cards], full_deck=unseen_cards)[0]
+
+    crib_score = expected_crib_score(discarded_cards=discarded_cards, unseen_cards=unseen_cards)
+
+    return hand_score, crib_score
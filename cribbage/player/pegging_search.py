@@ -0,0 +1,276 @@
+"""Module for choosing pegging plays by expectimax search"""
+
+from math import comb
+from time import perf_counter
+from cribbage.card import cards_list
+
+
+class SearchTimeout(Exception):
+    """Exception raised when a search runs out of time"""
+
+
+class PeggingSearch:
+    """Class for searching pegging plays against the possible holdings of an opponent"""
+
+    def __init__(self, maximum_depth, time_limit, table_size=200000):
+
+        self.maximum_depth = maximum_depth
+        self.time_limit = time_limit
+        self.table_size = table_size
+        self.transposition_table = {}
+        self.deadline = None
+        self.pegging_state = None
+
+        # One card of each order, used to play cards during the search
+        self.order_cards = [None] * (len(cards_list) + 1)
+
+    def choose(self, playable_cards, pegging_state, cards_left, unseen_cards, opponent_card_count,
+               opponent_stuck=False):
+        """Method for choosing the card to play that maximises the expected difference in pegging points"""
+
+        # Only the orders of cards matter during pegging, so cards of the same order are searched once
+        own_counts = [0] * (len(cards_list) + 1)
+        unseen_counts = [0] * (len(cards_list) + 1)
+
+        for i in cards_left:
+
+            own_counts[i.order] += 1
+            self.order_cards[i.order] = i
+
+        for i in unseen_cards:
+
+            unseen_counts[i.order] += 1
+            self.order_cards[i.order] = i
+
+        self.pegging_state = pegging_state
+        # Without a time limit the search always reaches its maximum depth
+        self.deadline = float("inf") if self.time_limit is None else perf_counter() + self.time_limit
+
+        # The transposition table is bounded by clearing it when it gets too big
+        if len(self.transposition_table) > self.table_size:
+
+            self.transposition_table.clear()
+
+        playable_orders = sorted({i.order for i in playable_cards}, reverse=True)
+
+        best_order = playable_orders[0]
+
+        # Search deeper and deeper until the time runs out, keeping the result of the deepest complete search
+        for depth in range(1, self.maximum_depth + 1):
+
+            history_length = len(pegging_state.history)
+
+            try:
+
+                # An opponent who has said go can't play again until the count ends
+                order_values = [
+                    (
+                        self.own_play_value(
+                            own_counts, unseen_counts, opponent_card_count, opponent_stuck, order, depth
+                        ),
+                        order
+                    )
+                    for order in playable_orders
+                ]
+
+            except SearchTimeout:
+
+                # Take back any cards played in the search
+                while len(pegging_state.history) > history_length:
+
+                    pegging_state.undo()
+
+                break
+
+            best_order = max(order_values)[1]
+
+        return next(i for i in playable_cards if i.order == best_order)
+
+    def own_play_value(self, own_counts, unseen_counts, opponent_count, opponent_stuck, order, depth):
+        """Method for finding the value of the computer playing a card of the given order"""
+
+        pegging_state = self.pegging_state
+
+        points = pegging_state.play(self.order_cards[order])
+
+        own_counts[order] -= 1
+
+        # Reaching thirty-one starts a new count, with the opponent to play
+        if pegging_state.count == 31:
+
+            pegging_state.end_count()
+
+            value = points + self.value(own_counts, unseen_counts, opponent_count, False, True, False, depth - 1)
+
+            pegging_state.undo()
+
+        else:
+
+            value = points + self.value(
+                own_counts, unseen_counts, opponent_count, False, True, opponent_stuck, depth - 1
+            )
+
+        own_counts[order] += 1
+
+        pegging_state.undo()
+
+        return value
+
+    def value(self, own_counts, unseen_counts, opponent_count, own_turn, last_own, opponent_stuck, depth):
+        """Method for finding the expected difference in points from a position in the search"""
+
+        pegging_state = self.pegging_state
+
+        # Once all cards are played the last card scores 1
+        if opponent_count == 0 and not any(own_counts):
+
+            point = pegging_state.end_count()
+
+            pegging_state.undo()
+
+            return point if last_own else -point
+
+        if depth == 0:
+
+            return 0.0
+
+        if perf_counter() > self.deadline:
+
+            raise SearchTimeout
+
+        key = (
+            tuple(own_counts), tuple(unseen_counts), opponent_count, own_turn, last_own, opponent_stuck, depth,
+            pegging_state.count, tuple(i.order for i in pegging_state.cards)
+        )
+
+        try:
+
+            return self.transposition_table[key]
+
+        except KeyError:
+
+            pass
+
+        remaining = 31 - pegging_state.count
+
+        if own_turn:
+
+            playable_orders = [
+                i for i in range(1, len(own_counts)) if own_counts[i] and self.order_cards[i].value <= remaining
+            ]
+
+            if playable_orders:
+
+                value = max(
+                    self.own_play_value(own_counts, unseen_counts, opponent_count, opponent_stuck, i, depth)
+                    for i in playable_orders
+                )
+
+            # If the computer can't play, the opponent continues unless they are also stuck
+            elif opponent_count > 0 and not opponent_stuck and any(
+                unseen_counts[i] and self.order_cards[i].value <= remaining for i in range(1, len(unseen_counts))
+            ):
+
+                value = self.value(own_counts, unseen_counts, opponent_count, False, last_own, opponent_stuck, depth)
+
+            else:
+
+                value = self.go_value(own_counts, unseen_counts, opponent_count, last_own, depth)
+
+        else:
+
+            value = self.opponent_value(own_counts, unseen_counts, opponent_count, last_own, opponent_stuck, depth)
+
+        self.transposition_table[key] = value
+
+        return value
+
+    def opponent_value(self, own_counts, unseen_counts, opponent_count, last_own, opponent_stuck, depth):
+        """Method for finding the expected value of the opponent's turn, over the cards they could hold"""
+
+        pegging_state = self.pegging_state
+
+        remaining = 31 - pegging_state.count
+
+        playable_orders = []
+
+        if opponent_count > 0 and not opponent_stuck:
+
+            playable_orders = [
+                i for i in range(1, len(unseen_counts)) if unseen_counts[i] and self.order_cards[i].value <= remaining
+            ]
+
+        unseen_total = sum(unseen_counts)
+        playable_total = sum(unseen_counts[i] for i in playable_orders)
+
+        # Chance that none of the opponent's cards can be played
+        if playable_total == 0:
+
+            stuck_probability = 1.0
+
+        else:
+
+            stuck_probability = comb(unseen_total - playable_total, opponent_count) / comb(unseen_total, opponent_count)
+
+        value = 0.0
+
+        if stuck_probability > 0:
+
+            own_can_play = any(
+                own_counts[i] and self.order_cards[i].value <= remaining for i in range(1, len(own_counts))
+            )
+
+            # The computer continues if it can, otherwise the count ends
+            if own_can_play:
+
+                stuck_value = self.value(own_counts, unseen_counts, opponent_count, True, last_own, True, depth)
+
+            else:
+
+                stuck_value = self.go_value(own_counts, unseen_counts, opponent_count, last_own, depth)
+
+            value += stuck_probability * stuck_value
+
+        # Otherwise the opponent plays one of the unseen cards, weighted by how many of each order are unseen
+        for i in playable_orders:
+
+            weight = (1 - stuck_probability) * unseen_counts[i] / playable_total
+
+            points = pegging_state.play(self.order_cards[i])
+
+            unseen_counts[i] -= 1
+
+            if pegging_state.count == 31:
+
+                pegging_state.end_count()
+
+                play_value = self.value(own_counts, unseen_counts, opponent_count - 1, True, False, False, depth - 1)
+
+                pegging_state.undo()
+
+            else:
+
+                play_value = self.value(own_counts, unseen_counts, opponent_count - 1, True, False, False, depth - 1)
+
+            unseen_counts[i] += 1
+
+            pegging_state.undo()
+
+            value += weight * (play_value - points)
+
+        return value
+
+    def go_value(self, own_counts, unseen_counts, opponent_count, last_own, depth):
+        """Method for finding the value of ending the count when neither player can play"""
+
+        pegging_state = self.pegging_state
+
+        # The last player to play scores 1 for the go
+        point = pegging_state.end_count()
+
+        # The player after the last player to play starts the next count
+        value = self.value(own_counts, unseen_counts, opponent_count, not last_own, last_own, False, depth)
+
+        pegging_state.undo()
+
+        return point + value if last_own else value - point
@@ -0,0 +1,144 @@
+"""Tests for relabelling suits so that equivalent hands share a canonical form"""
+
+import random
+import unittest
+from math import comb
+from itertools import combinations, permutations
+from cribbage.card import Card, cards_list, suits_list
+from cribbage.canonical import canonical_key, canonical_hand_key, canonical_pegging_key, canonical_hands, \
+    canonical_combination_indices, apply_permutation, invert_permutation, pack_masks, unpack_masks
+
+
+def full_deck():
+    """Function for creating one of every card"""
+
+    return [Card(rank=j, suit=i) for i in suits_list for j in cards_list]
+
+
+def random_relabelling(rng):
+    """Function for choosing a random permutation of the suits"""
+
+    return dict(zip(suits_list, rng.sample(suits_list, len(suits_list))))
+
+
+class TestCanonical(unittest.TestCase):
+
+    def test_keys_are_unchanged_by_relabelling_suits(self):
+
+        rng = random.Random(0)
+
+        deck = full_deck()
+
+        for _ in range(200):
+
+            cards = rng.sample(deck, 9)
+
+            hand, starter, played_cards = cards[:6], cards[6], cards[7:]
+
+            relabelling = random_relabelling(rng)
+
+            relabelled_hand = apply_permutation(hand, relabelling)
+            relabelled_starter = apply_permutation([starter], relabelling)[0]
+            relabelled_played_cards = apply_permutation(played_cards, relabelling)
+
+            self.assertEqual(canonical_hand_key(hand)[0], canonical_hand_key(relabelled_hand)[0])
+            self.assertEqual(
+                canonical_key(hand, starter, played_cards)[0],
+                canonical_key(relabelled_hand, relabelled_starter, relabelled_played_cards)[0]
+            )
+            self.assertEqual(
+                canonical_pegging_key(hand, played_cards, starter)[0],
+                canonical_pegging_key(relabelled_hand, relabelled_played_cards, relabelled_starter)[0]
+            )
+
+    def test_permutation_round_trips(self):
+
+        rng = random.Random(1)
+
+        hand = rng.sample(full_deck(), 6)
+
+        _, permutation = canonical_hand_key(hand)
+
+        self.assertEqual(apply_permutation(apply_permutation(hand, permutation), invert_permutation(permutation)), hand)
+
+    def test_combination_indices_round_trip(self):
+
+        rng = random.Random(2)
+
+        deck = full_deck()
+
+        for _ in range(200):
+
+            hand = rng.sample(deck, 6)
+
+            for length in [2, 4]:
+
+                _, permutation = canonical_hand_key(hand)
+
+                # Cards in canonical order are sorted by their relabelled suit and then by order
+                canonical_cards = sorted(
+                    apply_permutation(hand, permutation), key=lambda x: (suits_list.index(x.suit), x.order)
+                )
+
+                original_combinations = list(combinations(hand, length))
+                canonical_combinations = list(combinations(canonical_cards, length))
+
+                original_indices = canonical_combination_indices(cards=hand, permutation=permutation, length=length)
+
+                self.assertEqual(sorted(original_indices), list(range(len(original_combinations))))
+
+                for canonical_combination, original_index in zip(canonical_combinations, original_indices):
+
+                    self.assertEqual(
+                        set(apply_permutation(original_combinations[original_index], permutation)),
+                        set(canonical_combination)
+                    )
+
+    def test_relabelled_hands_share_canonical_combinations(self):
+
+        rng = random.Random(3)
+
+        hand = rng.sample(full_deck(), 6)
+
+        key, permutation = canonical_hand_key(hand)
+
+        original_indices = canonical_combination_indices(cards=hand, permutation=permutation, length=4)
+
+        canonical_combinations = [
+            set(apply_permutation(list(combinations(hand, 4))[i], permutation)) for i in original_indices
+        ]
+
+        for relabelling in permutations(suits_list):
+
+            relabelled_hand = apply_permutation(hand, dict(zip(suits_list, relabelling)))
+
+            relabelled_key, relabelled_permutation = canonical_hand_key(relabelled_hand)
+
+            relabelled_indices = canonical_combination_indices(
+                cards=relabelled_hand, permutation=relabelled_permutation, length=4
+            )
+
+            self.assertEqual(relabelled_key, key)
+            self.assertEqual(
+                [
+                    set(apply_permutation(list(combinations(relabelled_hand, 4))[i], relabelled_permutation))
+                    for i in relabelled_indices
+                ],
+                canonical_combinations
+            )
+
+    def test_canonical_hands_cover_every_hand(self):
+
+        hands = list(canonical_hands(4))
+
+        self.assertEqual(sum(multiplicity for _, multiplicity in hands), comb(52, 4))
+        self.assertEqual(len({masks for masks, _ in hands}), len(hands))
+
+        for masks, _ in hands[:1000]:
+
+            self.assertEqual(unpack_masks(pack_masks(masks)), masks)
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Tests for calculating the exact expected score of a crib"""
+
+import random
+import unittest
+from itertools import combinations
+from cribbage.card import Card, cards_list, suits_list
+from cribbage.deck.score_table import score_five_cards
+from cribbage.player.crib_expectation import expected_crib_score, total_crib_score
+
+
+def brute_force_crib_score(discarded_cards, unseen_cards):
+    """Function for averaging the crib score by scoring every opponent discard and shared card in turn"""
+
+    total_score = 0
+    possibilities = 0
+
+    for opponent_cards in combinations(unseen_cards, 2):
+
+        crib_cards = list(discarded_cards) + list(opponent_cards)
+
+        for shared_card in unseen_cards:
+
+            if shared_card in opponent_cards:
+
+                continue
+
+            total_score += score_five_cards(crib_cards, shared_card, is_crib=True)
+            possibilities += 1
+
+    return total_score, possibilities
+
+
+class TestCribExpectation(unittest.TestCase):
+
+    def test_matches_brute_force(self):
+
+        deck = [Card(rank=j, suit=i) for i in suits_list for j in cards_list]
+
+        rng = random.Random(0)
+
+        hands = [rng.sample(deck, 6) for _ in range(2)]
+
+        # Pairs, suited cards and Jacks are the groups most easily scored wrongly
+        hands.append([Card("5", "H"), Card("5", "C"), Card("J", "H"), Card("2", "D"), Card("9", "S"), Card("K", "S")])
+        hands.append([Card("J", "D"), Card("4", "D"), Card("7", "C"), Card("8", "C"), Card("Q", "H"), Card("A", "S")])
+
+        for hand_cards in hands:
+
+            unseen_cards = [i for i in deck if i not in hand_cards]
+
+            for discarded_cards in [hand_cards[:2], hand_cards[2:4]]:
+
+                total_score, possibilities = brute_force_crib_score(discarded_cards, unseen_cards)
+
+                self.assertEqual(total_crib_score(discarded_cards, unseen_cards), (total_score, possibilities))
+                self.assertAlmostEqual(
+                    expected_crib_score(discarded_cards, unseen_cards), total_score / possibilities, places=9
+                )
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for caching Computer discard scores by canonical hand"""
+
+import random
+import unittest
+from cribbage import Computer
+from cribbage.card import Card, cards_list, suits_list
+from cribbage.canonical import apply_permutation
+from cribbage.deck import Hand, unique_combinations
+from cribbage.player.decision_cache import DecisionCache
+
+
+def discard_scores(computer, hand_cards, has_crib):
+    """Function for scoring every combination a Computer could keep from a hand"""
+
+    deck = [Card(rank=j, suit=i) for i in suits_list for j in cards_list]
+
+    computer.add_cards_list(deck)
+    computer.hand = Hand(is_crib=False)
+
+    if has_crib:
+
+        computer.give_crib()
+
+    else:
+
+        computer.remove_crib()
+
+    for i in hand_cards:
+
+        computer.hand.add_card(i)
+
+    full_deck = [i for i in deck if i not in hand_cards]
+
+    return computer.calculate_total_average_scores(
+        card_combinations=unique_combinations(computer.hand.cards, 4, 4), full_deck=full_deck
+    )
+
+
+class TestDecisionCache(unittest.TestCase):
+
+    def test_relabelled_hand_uses_cached_scores(self):
+
+        rng = random.Random(0)
+
+        deck = [Card(rank=j, suit=i) for i in suits_list for j in cards_list]
+
+        for _ in range(3):
+
+            hand_cards = rng.sample(deck, 6)
+
+            relabelled_hand = apply_permutation(hand_cards, dict(zip(suits_list, rng.sample(suits_list, 4))))
+
+            for has_crib in [False, True]:
+
+                cached_computer = Computer("perfect", cache_size=16)
+
+                discard_scores(cached_computer, hand_cards, has_crib)
+
+                cached_scores = discard_scores(cached_computer, relabelled_hand, has_crib)
+
+                self.assertEqual(cached_computer.cache_statistics()["hits"], 1)
+
+                # Each cached score must be put back in the position of the relabelled hand's own combination
+                for cached_score, score in zip(
+                        cached_scores, discard_scores(Computer("perfect"), relabelled_hand, has_crib)
+                ):
+
+                    self.assertAlmostEqual(cached_score, score, places=9)
+
+    def test_crib_and_no_crib_are_cached_apart(self):
+
+        hand_cards = [Card("5", "H"), Card("5", "C"), Card("J", "H"), Card("2", "D"), Card("9", "S"), Card("K", "S")]
+
+        computer = Computer("perfect", cache_size=16)
+
+        self.assertNotEqual(discard_scores(computer, hand_cards, False), discard_scores(computer, hand_cards, True))
+        self.assertEqual(computer.cache_statistics()["hits"], 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+
+        cache = DecisionCache(maximum_size=2)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        self.assertEqual(cache.get("a"), 1)
+
+        cache.put("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.statistics()["evictions"], 1)
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Tests for writing and reading game logs"""
+
+import os
+import random
+import tempfile
+import unittest
+from cribbage.game import GameEngine, GameLogWriter, GameLogReader, computer_players, simulate_games
+from cribbage.game.game_log import event_win
+
+
+def easy_players():
+    """Function for creating a pair of easy Computer players, defined at module level so workers can use it"""
+
+    return computer_players("easy", "easy")
+
+
+def play_logged_games(path, games, seed, append=False):
+    """Function for playing easy games into a game log, returning the results"""
+
+    with GameLogWriter(path, append=append) as game_log:
+
+        engine = GameEngine(*easy_players(), rng=random.Random(seed), game_log=game_log)
+
+        return [engine.play_game() for _ in range(games)]
+
+
+def logged_scores(path):
+    """Function for summing each player's logged points in each game, with the number of win events in each game"""
+
+    log = GameLogReader(path)
+
+    scores = {}
+    wins = {}
+
+    for game, event, player, points in zip(
+            log.records["game"].tolist(), log.records["event"].tolist(), log.records["player"].tolist(),
+            log.records["points"].tolist()
+    ):
+
+        scores.setdefault(game, [0, 0])[player] += points
+
+        if event == event_win:
+
+            wins[game] = wins.get(game, 0) + 1
+
+    log.close()
+
+    return scores, wins
+
+
+class TestGameLog(unittest.TestCase):
+
+    def setUp(self):
+
+        self.directory = tempfile.TemporaryDirectory()
+
+        self.path = os.path.join(self.directory.name, "games.log")
+
+    def tearDown(self):
+
+        self.directory.cleanup()
+
+    def test_logged_points_add_up_to_final_scores(self):
+
+        results = play_logged_games(self.path, games=3, seed=1)
+
+        scores, wins = logged_scores(self.path)
+
+        self.assertEqual(scores, {i: result["scores"] for i, result in enumerate(results)})
+        self.assertEqual(wins, {i: 1 for i in range(3)})
+
+    def test_writing_again_replaces_the_log(self):
+
+        play_logged_games(self.path, games=2, seed=1)
+        results = play_logged_games(self.path, games=2, seed=2)
+
+        scores, wins = logged_scores(self.path)
+
+        self.assertEqual(scores, {i: result["scores"] for i, result in enumerate(results)})
+        self.assertEqual(wins, {i: 1 for i in range(2)})
+
+    def test_appending_numbers_games_on(self):
+
+        results = play_logged_games(self.path, games=2, seed=1)
+        results += play_logged_games(self.path, games=2, seed=2, append=True)
+
+        scores, wins = logged_scores(self.path)
+
+        self.assertEqual(scores, {i: result["scores"] for i, result in enumerate(results)})
+        self.assertEqual(wins, {i: 1 for i in range(4)})
+
+    def test_appending_checks_the_header(self):
+
+        with open(self.path, "wb") as other_file:
+
+            other_file.write(b"not a game log at all")
+
+        with self.assertRaises(ValueError):
+
+            GameLogWriter(self.path, append=True)
+
+    def test_simulating_again_replaces_the_logs(self):
+
+        for _ in range(2):
+
+            simulate_games(
+                2, player_factory=easy_players, workers=1, seed=0, chunk_size=2, log_directory=self.directory.name
+            )
+
+        scores, wins = logged_scores(os.path.join(self.directory.name, "games_0_00000.log"))
+
+        self.assertEqual(sorted(scores), [0, 1])
+        self.assertEqual(wins, {0: 1, 1: 1})
+        self.assertTrue(all(121 in i for i in scores.values()))
+
+
+if __name__ == "__main__":
+
+    unittest.main()
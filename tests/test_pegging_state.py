@@ -0,0 +1,125 @@
+"""Tests for scoring pegging incrementally with an undoable state"""
+
+import random
+import unittest
+from cribbage.card import Card, cards_list, suits_list
+from cribbage.pegging import PeggingState
+
+
+def naive_play_score(pile):
+    """Function for scoring the last card of a pile by looking back over the whole pile"""
+
+    score = 0
+
+    count = sum(i.value for i in pile)
+
+    if count == 15 or count == 31:
+
+        score += 2
+
+    # Count the cards of the same rank at the end of the pile
+    same_rank = 1
+
+    while same_rank < len(pile) and pile[-same_rank - 1].order == pile[-1].order:
+
+        same_rank += 1
+
+    score += same_rank * (same_rank - 1)
+
+    # The longest run of three or more made by the last cards, in any order
+    for length in range(len(pile), 2, -1):
+
+        orders = sorted(i.order for i in pile[-length:])
+
+        if orders == list(range(orders[0], orders[0] + length)):
+
+            score += length
+
+            break
+
+    return score
+
+
+class TestPeggingState(unittest.TestCase):
+
+    def test_matches_naive_scoring_with_undo(self):
+
+        rng = random.Random(0)
+
+        deck = [Card(rank=j, suit=i) for i in suits_list for j in cards_list]
+
+        for _ in range(300):
+
+            # Small decks of close ranks give many runs, pairs and fifteens
+            low_order = rng.randint(1, 9)
+            cards = [i for i in deck if low_order <= i.order < low_order + 5]
+
+            rng.shuffle(cards)
+
+            state = PeggingState()
+            pile = []
+
+            # The state before each action and the points the action scored, to check undo against
+            snapshots = []
+
+            while cards:
+
+                playable_cards = [i for i in cards if state.can_play(i)]
+
+                snapshot = (state.count, list(state.cards), list(pile), list(cards))
+
+                if playable_cards:
+
+                    card = rng.choice(playable_cards)
+
+                    cards.remove(card)
+                    pile.append(card)
+
+                    self.assertEqual(state.play(card), naive_play_score(pile))
+
+                # Neither side can play, so the count ends with a point for the go
+                else:
+
+                    self.assertEqual(state.end_count(), 1 if 0 < sum(i.value for i in pile) < 31 else 0)
+
+                    pile = []
+
+                snapshots.append(snapshot)
+
+                self.assertEqual(state.count, sum(i.value for i in pile))
+                self.assertEqual(state.cards, pile)
+
+                # Sometimes take back a few actions, as the search does, and check the earlier state is restored
+                if rng.random() < 0.3:
+
+                    for _ in range(rng.randint(1, min(3, len(snapshots)))):
+
+                        state.undo()
+
+                        count, state_cards, pile, cards = snapshots.pop()
+
+                        self.assertEqual((state.count, state.cards), (count, state_cards))
+
+    def test_runs_in_any_order(self):
+
+        state = PeggingState()
+
+        scores = [state.play(Card(rank, "H")) for rank in ["4", "6", "5", "3", "7"]]
+
+        # The five makes fifteen as well as a run of three
+        self.assertEqual(scores, [0, 0, 2 + 3, 4, 5])
+
+    def test_pairs_and_thirty_one(self):
+
+        state = PeggingState()
+
+        scores = [state.play(Card(rank, suit)) for rank, suit in [("K", "H"), ("K", "C"), ("K", "D"), ("A", "S")]]
+
+        self.assertEqual(scores, [0, 2, 6, 2])
+        self.assertEqual(state.count, 31)
+        self.assertEqual(state.end_count(), 0)
+
+
+if __name__ == "__main__":
+
+    unittest.main()
@@ -0,0 +1,104 @@
+"""Tests for scoring hands with the rank score table"""
+
+import random
+import unittest
+from cribbage.card import Card, cards_list, suits_list
+from cribbage.deck import Hand, score_breakdown
+from cribbage.deck.score_table import score_five_cards, score_all_shared_cards
+
+
+def full_deck():
+    """Function for creating one of every card"""
+
+    return [Card(rank=j, suit=i) for i in suits_list for j in cards_list]
+
+
+def legacy_score(hand_cards, shared_card, is_crib):
+    """Function for scoring a hand with the shared card added, using the original Hand counting methods"""
+
+    hand = Hand(is_crib=is_crib)
+
+    for i in hand_cards + [shared_card]:
+
+        hand.add_card(i)
+
+    hand.unique_card_combinations()
+
+    runs_of_three, runs_of_four, runs_of_five = hand.count_runs()
+    four_card_flush, five_card_flush = hand.count_flushes(shared_card)
+
+    return (
+        hand.count_fifteens() * 2 + hand.count_pairs() * 2 + runs_of_three * 3 + runs_of_four * 4
+        + runs_of_five * 5 + four_card_flush * 4 + five_card_flush * 5 + hand.count_nobs(shared_card)
+    )
+
+
+class TestScoreTable(unittest.TestCase):
+
+    def test_table_scores_match_legacy_counting(self):
+
+        rng = random.Random(0)
+
+        deck = full_deck()
+
+        for _ in range(2000):
+
+            cards = rng.sample(deck, 5)
+
+            for is_crib in [False, True]:
+
+                expected_score = legacy_score(hand_cards=cards[:4], shared_card=cards[4], is_crib=is_crib)
+
+                self.assertEqual(score_five_cards(cards[:4], cards[4], is_crib), expected_score)
+                self.assertEqual(score_breakdown(cards[:4], cards[4], is_crib).total, expected_score)
+
+    def test_all_shared_cards_match_single_scores(self):
+
+        rng = random.Random(1)
+
+        deck = full_deck()
+
+        for _ in range(50):
+
+            hand_cards = rng.sample(deck, 4)
+
+            shared_cards = [i for i in deck if i not in hand_cards]
+
+            for is_crib in [False, True]:
+
+                self.assertEqual(
+                    score_all_shared_cards(hand_cards, shared_cards, is_crib),
+                    [score_five_cards(hand_cards, i, is_crib) for i in shared_cards]
+                )
+
+    def test_known_hands(self):
+
+        best_hand = [Card("5", "H"), Card("5", "C"), Card("5", "D"), Card("J", "S")]
+
+        self.assertEqual(score_five_cards(best_hand, Card("5", "S"), False), 29)
+
+        flush_hand = [Card("2", "H"), Card("4", "H"), Card("6", "H"), Card("8", "H")]
+
+        # The cards are all even, so only the flush scores - and a crib only scores a five card flush
+        self.assertEqual(score_five_cards(flush_hand, Card("Q", "S"), False), 4)
+        self.assertEqual(score_five_cards(flush_hand, Card("Q", "S"), True), 0)
+        self.assertEqual(score_five_cards(flush_hand, Card("K", "H"), True), 5)
+
+    def test_scoring_leaves_hand_unchanged(self):
+
+        hand = Hand(is_crib=False)
+
+        for i in [Card("5", "H"), Card("6", "C"), Card("7", "D"), Card("J", "S")]:
+
+            hand.add_card(i)
+
+        cards = list(hand.cards)
+
+        hand.score_hand(shared_card=Card("8", "S"))
+
+        self.assertEqual(hand.cards, cards)
+
+
+if __name__ == "__main__":
+
+    unittest.main()
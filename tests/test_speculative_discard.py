@@ -0,0 +1,167 @@
+"""Tests for scoring the Computer's discard in a background thread"""
+
+import random
+import unittest
+from cribbage import Deck, Computer
+
+
+def deal_computer(seed, has_crib=False):
+    """Function for creating a perfect Computer dealt six cards from a deck shuffled with a seed"""
+
+    deck = Deck(rng=seed)
+    deck.populate()
+
+    all_cards = list(deck.cards)
+
+    deck.shuffle()
+
+    computer = Computer("perfect")
+    computer.add_cards_list(all_cards)
+
+    if has_crib:
+
+        computer.give_crib()
+
+    for _ in range(6):
+
+        computer.hand.add_card(deck.draw_card())
+
+    return computer
+
+
+def card_names(cards):
+    """Function for converting cards to rank and suit text, in order"""
+
+    return sorted(i.rank + i.suit for i in cards)
+
+
+def count_discard_scoring(computer):
+    """Function for counting the times a Computer scores its discard on the calling thread, returning the count"""
+
+    calls = [0]
+
+    calculate_discard_scores = computer.calculate_discard_scores
+
+    def counted_calculate_discard_scores():
+
+        calls[0] += 1
+
+        return calculate_discard_scores()
+
+    computer.calculate_discard_scores = counted_calculate_discard_scores
+
+    return calls
+
+
+class TestSpeculativeDiscard(unittest.TestCase):
+
+    def test_speculative_discard_matches_synchronous_discard(self):
+
+        for seed in range(3):
+
+            for has_crib in [False, True]:
+
+                synchronous_computer = deal_computer(seed=seed, has_crib=has_crib)
+                speculative_computer = deal_computer(seed=seed, has_crib=has_crib)
+
+                speculative_computer.start_discard()
+
+                self.assertEqual(
+                    card_names(speculative_computer.discard()), card_names(synchronous_computer.discard())
+                )
+
+                speculative_computer.close()
+
+    def test_crib_change_after_start_is_not_ignored(self):
+
+        for seed in range(3):
+
+            synchronous_computer = deal_computer(seed=seed, has_crib=True)
+            speculative_computer = deal_computer(seed=seed, has_crib=False)
+
+            # The discard is started before the crib is given, so its scores must not be used
+            speculative_computer.start_discard()
+            speculative_computer.give_crib()
+
+            self.assertEqual(card_names(speculative_computer.discard()), card_names(synchronous_computer.discard()))
+
+            speculative_computer.close()
+
+    def test_speculative_discard_leaves_hand_unchanged_until_discard(self):
+
+        computer = deal_computer(seed=0)
+
+        hand_names = card_names(computer.hand.cards)
+
+        computer.start_discard()
+
+        self.assertEqual(card_names(computer.hand.cards), hand_names)
+
+        discarded_cards = computer.discard()
+
+        self.assertEqual(sorted(card_names(computer.hand.cards) + card_names(discarded_cards)), hand_names)
+
+        computer.close()
+
+    def test_close_abandons_discard(self):
+
+        computer = deal_computer(seed=0)
+
+        computer.start_discard()
+        computer.close()
+
+        calls = count_discard_scoring(computer)
+
+        # The abandoned discard isn't used, so the discard is scored again
+        random.seed(0)
+
+        self.assertEqual(len(computer.discard()), 2)
+        self.assertEqual(calls, [1])
+
+    def test_difficulty_change_after_start_is_not_ignored(self):
+
+        computer = deal_computer(seed=0)
+
+        computer.start_discard()
+        computer.difficulty = "easy"
+
+        calls = count_discard_scoring(computer)
+
+        computer.discard()
+
+        self.assertEqual(calls, [1])
+
+        computer.close()
+
+    def test_unchanged_discard_is_not_scored_again(self):
+
+        computer = deal_computer(seed=0)
+
+        computer.start_discard()
+
+        calls = count_discard_scoring(computer)
+
+        computer.discard()
+
+        self.assertEqual(calls, [0])
+
+        computer.close()
+
+    def test_sampling_discard_is_not_started_early(self):
+
+        computer = deal_computer(seed=0)
+        computer.mode = "sampling"
+
+        # Sampling shares the random module with the game, so it isn't run in the background
+        random.seed(0)
+
+        computer.start_discard()
+
+        self.assertIsNone(computer.speculative_discard)
+        self.assertEqual(random.random(), random.Random(0).random())
+
+        computer.close()
+
+if __name__ == "__main__":
+
+    unittest.main()